@@ -0,0 +1,119 @@
+"""Seeded synthetic career catalogs and student cohorts for benchmarking.
+
+Skill popularity follows a Zipf-like distribution so that a few skills
+(python, sql, ...) appear in many careers and a long tail appears in few,
+as in the real catalog.
+"""
+import numpy as np
+import pandas as pd
+
+from models.student import Student
+from services.profile_manager import INTEREST_OPTIONS, CAREER_GOAL_OPTIONS
+
+CORE_SKILLS = [
+    'python', 'sql', 'statistics', 'machine_learning', 'java', 'javascript',
+    'aws', 'docker', 'linux', 'excel', 'communication', 'project_management',
+    'data_analysis', 'html', 'css', 'react', 'kubernetes', 'tableau',
+    'cloud_computing', 'deep_learning', 'agile', 'networking', 'cybersecurity'
+]
+
+INDUSTRIES = ['Technology', 'Business', 'Design', 'Healthcare', 'Finance', 'Education', 'Research']
+INDUSTRY_WEIGHTS = [0.45, 0.15, 0.08, 0.1, 0.1, 0.06, 0.06]
+GROWTH_LEVELS = ['Low', 'Medium', 'High', 'Very High']
+GROWTH_WEIGHTS = [0.1, 0.35, 0.4, 0.15]
+EDUCATION_LEVELS = ['High School', 'Associate', 'Bachelor', 'Master', 'PhD']
+EDUCATION_WEIGHTS = [0.05, 0.1, 0.55, 0.25, 0.05]
+
+TEXT_TEMPLATES = [
+    "I have worked with {0} and {1} on several projects and want to learn {2}.",
+    "Experienced in {0}, comfortable with {1}; currently studying {2}.",
+    "My background is {0}. I enjoy {1} and some {2} in my spare time."
+]
+TEXT_TERMS = [
+    'python', 'java', 'javascript', 'sql', 'machine learning', 'data analysis',
+    'aws', 'docker', 'kubernetes', 'react', 'statistics', 'excel', 'tableau',
+    'deep learning', 'cloud computing', 'git', 'agile', 'leadership', 'teamwork',
+    'painting', 'gardening', 'cooking'
+]
+
+
+def skill_vocabulary(n_careers):
+    """Skill names for a catalog; the vocabulary grows sub-linearly with its size"""
+    n_skills = max(len(CORE_SKILLS) * 4, int(40 * np.sqrt(n_careers)))
+    return CORE_SKILLS + [f"skill_{i}" for i in range(n_skills - len(CORE_SKILLS))]
+
+
+def _zipf_weights(n, exponent=1.1):
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def _sample_skill_lists(rng, vocabulary, weights, n_rows, low, high):
+    """Draw low..high distinct skills per row, favouring popular skills"""
+    counts = rng.integers(low, high + 1, size=n_rows)
+    # Oversample with replacement and drop duplicates per row, which is much
+    # faster than weighted sampling without replacement row by row.
+    draws = rng.choice(len(vocabulary), size=(n_rows, high * 2), p=weights)
+    rows = []
+    for row, count in zip(draws, counts):
+        picked = list(dict.fromkeys(row.tolist()))[:count]
+        rows.append([vocabulary[i] for i in picked])
+    return rows
+
+
+def generate_careers(n_careers, seed=0):
+    """Generate a careers DataFrame with the same columns as data/careers.csv"""
+    rng = np.random.default_rng(seed)
+    vocabulary = skill_vocabulary(n_careers)
+    weights = _zipf_weights(len(vocabulary))
+
+    required = _sample_skill_lists(rng, vocabulary, weights, n_careers, 3, 6)
+    preferred = _sample_skill_lists(rng, vocabulary, weights, n_careers, 2, 4)
+    salary_low = rng.integers(30, 150, size=n_careers) * 1000
+    salary_high = salary_low + rng.integers(10, 60, size=n_careers) * 1000
+
+    return pd.DataFrame({
+        'career_id': np.arange(1, n_careers + 1),
+        'career_title': [f"Career {i}" for i in range(1, n_careers + 1)],
+        'required_skills': [','.join(skills) for skills in required],
+        'preferred_skills': [','.join(skills) for skills in preferred],
+        'industry': rng.choice(INDUSTRIES, size=n_careers, p=INDUSTRY_WEIGHTS),
+        'growth_potential': rng.choice(GROWTH_LEVELS, size=n_careers, p=GROWTH_WEIGHTS),
+        'salary_range': [f"{low:,}-{high:,}" for low, high in zip(salary_low, salary_high)],
+        'education_level': rng.choice(EDUCATION_LEVELS, size=n_careers, p=EDUCATION_WEIGHTS)
+    })
+
+
+def generate_students(n_students, n_careers=1000, seed=0):
+    """Generate Student objects whose skills follow the catalog's skill distribution"""
+    rng = np.random.default_rng(seed + 1)
+    vocabulary = skill_vocabulary(n_careers)
+    weights = _zipf_weights(len(vocabulary))
+
+    skills = _sample_skill_lists(rng, vocabulary, weights, n_students, 1, 8)
+    interests = rng.integers(1, 4, size=n_students)
+    education = rng.choice(EDUCATION_LEVELS, size=n_students, p=EDUCATION_WEIGHTS)
+    goals = rng.integers(0, len(CAREER_GOAL_OPTIONS) - 1, size=n_students)
+
+    return [
+        Student(
+            student_id=i + 1,
+            name=f"Student {i + 1}",
+            education_level=str(education[i]),
+            skills=skills[i],
+            interests=[str(x) for x in rng.choice(INTEREST_OPTIONS, size=interests[i], replace=False)],
+            goals=CAREER_GOAL_OPTIONS[goals[i]]
+        )
+        for i in range(n_students)
+    ]
+
+
+def generate_texts(n_texts, seed=0):
+    """Generate free-text profile descriptions for skill extraction"""
+    rng = np.random.default_rng(seed + 2)
+    texts = []
+    for _ in range(n_texts):
+        template = TEXT_TEMPLATES[rng.integers(len(TEXT_TEMPLATES))]
+        terms = rng.choice(TEXT_TERMS, size=3, replace=False)
+        texts.append(template.format(*terms))
+    return texts
@@ -0,0 +1,72 @@
+"""Throughput benchmark for headless report rendering.
+
+Usage:
+    python -m benchmarks.report_rendering --reports 200 --workers 1 2 4
+"""
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from utils.visualizer import render_cohort_reports
+
+CAREERS = [
+    'Data Scientist', 'Software Engineer', 'Web Developer', 'Data Analyst',
+    'AI Engineer', 'DevOps Engineer', 'UX Designer', 'Product Manager'
+]
+SKILLS = ['python', 'sql', 'statistics', 'machine_learning', 'docker', 'aws', 'react', 'excel']
+
+
+def make_reports(n_reports, seed=0):
+    """Build synthetic per-student report inputs"""
+    rng = random.Random(seed)
+    reports = []
+    for i in range(n_reports):
+        careers = rng.sample(CAREERS, 5)
+        recommendations = [
+            {
+                'career': career,
+                'overall_score': rng.random(),
+                'skill_match_percentage': round(rng.random() * 100, 1)
+            }
+            for career in careers
+        ]
+        reports.append({
+            'student_name': f'Student {i}',
+            'recommendations': recommendations,
+            'learning_path': {
+                'target_career': careers[0],
+                'skill_gaps': rng.sample(SKILLS, rng.randint(1, 4))
+            }
+        })
+    return reports
+
+
+def run(n_reports, workers, image_format='png'):
+    """Render n_reports reports and return the throughput in reports/second"""
+    reports = make_reports(n_reports)
+    output_dir = tempfile.mkdtemp(prefix='career_reports_')
+    try:
+        start = time.perf_counter()
+        render_cohort_reports(reports, output_dir=output_dir, image_format=image_format, workers=workers)
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return n_reports / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reports', type=int, default=100)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--format', default='png', choices=['png', 'svg'])
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        throughput = run(args.reports, workers, args.format)
+        print(f"workers={workers:<3} {throughput:8.1f} reports/second")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Scaling benchmark for sharded scoring across worker processes.
+
+Usage:
+    python -m benchmarks.sharded_scoring --sizes 100000 1000000 --workers 1 2 4 8 --queries 200
+
+Compares single-query latency and throughput of in-process scoring with
+ShardedScorer at each worker count, and times a snapshot re-attach.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.generators import generate_careers, generate_students
+from models.recommender_model import CareerRecommender
+
+
+def _time_queries(recommender, students, top_n):
+    latencies = []
+    start = time.perf_counter()
+    for student in students:
+        call_start = time.perf_counter()
+        recommender.recommend_careers(student.skills, student.interests, top_n)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p95_ms': float(np.percentile(latencies_ms, 95)),
+        'queries_per_second': len(students) / elapsed
+    }
+
+
+def run(n_careers, worker_counts, n_queries, top_n=10, seed=0):
+    """Benchmark one catalog size at each worker count; 0 workers means in-process"""
+    careers_df = generate_careers(n_careers, seed=seed)
+    students = generate_students(n_queries, n_careers=n_careers, seed=seed)
+    recommender = CareerRecommender()
+    recommender.load_data(careers_df)
+
+    results = {0: _time_queries(recommender, students, top_n)}
+    for workers in worker_counts:
+        recommender.enable_sharded_scoring(workers)
+        try:
+            results[workers] = _time_queries(recommender, students, top_n)
+
+            # Re-publish the same catalog as a new snapshot to time a re-attach
+            recommender.load_data(careers_df)
+            start = time.perf_counter()
+            recommender.scorer.start()
+            results[workers]['reattach_seconds'] = time.perf_counter() - start
+        finally:
+            recommender.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('--top-n', type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(f"{size} careers")
+        for workers, stats in run(size, args.workers, args.queries, args.top_n).items():
+            label = 'in-process' if workers == 0 else f"{workers} workers"
+            reattach = stats.get('reattach_seconds')
+            print(f"  {label:<12} p50 {stats['p50_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms  "
+                  f"{stats['queries_per_second']:9.1f} queries/s"
+                  + (f"  re-attach {reattach:.3f} s" if reattach is not None else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+"""Reproducible benchmarks for the recommendation pipeline.
+
+Usage:
+    python -m benchmarks.suite run --sizes 1000 10000 --students 200 --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.10
+
+Every benchmark reports latency percentiles, throughput and peak traced
+memory. compare exits with status 1 when any benchmark regressed by more
+than the threshold.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.generators import generate_careers, generate_students, generate_texts
+from models.recommender_model import CareerRecommender
+from services.career_matcher import CareerMatcher
+from services.path_generator import PathGenerator
+
+RESOURCES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'learning_resources.json'
+)
+
+# Metric name -> True when larger values are better
+COMPARED_METRICS = {
+    'p50_ms': False,
+    'p95_ms': False,
+    'throughput_per_second': True,
+    'peak_memory_mb': False
+}
+
+
+def measure(func, calls):
+    """Time each call, then replay the first call under tracemalloc for peak memory"""
+    calls = list(calls)
+    gc.collect()
+    latencies = []
+    start = time.perf_counter()
+    for args in calls:
+        call_start = time.perf_counter()
+        func(*args)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*calls[0])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'calls': len(latencies),
+        'mean_ms': float(latencies_ms.mean()),
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p95_ms': float(np.percentile(latencies_ms, 95)),
+        'p99_ms': float(np.percentile(latencies_ms, 99)),
+        'max_ms': float(latencies_ms.max()),
+        'throughput_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'peak_memory_mb': peak / (1024 * 1024)
+    }
+
+
+def run_size(n_careers, n_students, load_repeats=3, seed=0):
+    """Run every benchmark against one synthetic catalog size"""
+    careers_df = generate_careers(n_careers, seed=seed)
+    students = generate_students(n_students, n_careers=n_careers, seed=seed)
+    texts = generate_texts(n_students, seed=seed)
+    targets = careers_df['career_title'].sample(
+        n=n_students, replace=True, random_state=seed
+    ).tolist()
+
+    workdir = tempfile.mkdtemp(prefix='career_bench_')
+    try:
+        careers_path = os.path.join(workdir, 'careers.csv')
+        careers_df.to_csv(careers_path, index=False)
+
+        results = {}
+        results['load_data'] = measure(
+            lambda df: CareerRecommender().load_data(df),
+            [(careers_df,)] * load_repeats
+        )
+
+        recommender = CareerRecommender()
+        recommender.load_data(careers_df)
+        results['recommend_careers'] = measure(
+            recommender.recommend_careers,
+            [(s.skills, s.interests, 5) for s in students]
+        )
+
+        matcher = CareerMatcher(careers_path)
+        results['find_career_matches'] = measure(
+            matcher.find_career_matches, [(s, 5) for s in students]
+        )
+
+        path_generator = PathGenerator(careers_path, resources_data_path=RESOURCES_PATH)
+        results['generate_learning_path'] = measure(
+            path_generator.generate_learning_path, list(zip(students, targets))
+        )
+
+        results['extract_skills_from_text'] = _measure_skill_extraction(texts)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+
+def _measure_skill_extraction(texts):
+    try:
+        from services.nlp_processor import NLPProcessor
+        nlp_processor = NLPProcessor()
+    except Exception as e:
+        # The VADER lexicon is needed to construct the processor
+        return {'skipped': f"NLPProcessor unavailable ({type(e).__name__})"}
+    return measure(nlp_processor.extract_skills_from_text, [(text,) for text in texts])
+
+
+def run(sizes, n_students, load_repeats=3, seed=0):
+    """Run the suite for each catalog size and return a JSON-serializable report"""
+    report = {
+        'meta': {
+            'seed': seed,
+            'students': n_students,
+            'load_repeats': load_repeats,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': {}
+    }
+    for size in sizes:
+        print(f"Benchmarking {size} careers...")
+        report['results'][str(size)] = run_size(size, n_students, load_repeats, seed)
+        _print_results(report['results'][str(size)])
+    return report
+
+
+def _print_results(results):
+    for name, stats in results.items():
+        if 'skipped' in stats:
+            print(f"  {name:<26} skipped ({stats['skipped']})")
+            continue
+        print(f"  {name:<26} p50 {stats['p50_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms  "
+              f"p99 {stats['p99_ms']:9.3f} ms  {stats['throughput_per_second']:10.1f}/s  "
+              f"peak {stats['peak_memory_mb']:8.2f} MB")
+
+
+def compare(baseline, current, threshold=0.10):
+    """List regressions larger than threshold (a fraction) between two reports"""
+    regressions = []
+    for size, benchmarks in current['results'].items():
+        for name, stats in benchmarks.items():
+            base = baseline['results'].get(size, {}).get(name)
+            if not base or 'skipped' in base or 'skipped' in stats:
+                continue
+            for metric, higher_is_better in COMPARED_METRICS.items():
+                old, new = base[metric], stats[metric]
+                if not old:
+                    continue
+                change = (new - old) / old
+                if (change < -threshold) if higher_is_better else (change > threshold):
+                    regressions.append({
+                        'size': size,
+                        'benchmark': name,
+                        'metric': metric,
+                        'baseline': old,
+                        'current': new,
+                        'change': change
+                    })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmark suite')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[1000])
+    run_parser.add_argument('--students', type=int, default=200)
+    run_parser.add_argument('--load-repeats', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', default='benchmark_results.json')
+
+    compare_parser = subparsers.add_parser('compare', help='Flag regressions between two runs')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        report = run(args.sizes, args.students, args.load_repeats, args.seed)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r['size']:>8} {r['benchmark']:<26} {r['metric']:<22} "
+              f"{r['baseline']:.3f} -> {r['current']:.3f} ({r['change']:+.1%})")
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
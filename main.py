@@ -1,5 +1,10 @@
+import argparse
 import pandas as pd
-from services.profile_manager import ProfileManager
+from models.recommender_model import DEFAULT_N_FEATURES
+from services.profile_manager import (
+    ProfileManager, SKILL_OPTIONS, INTEREST_OPTIONS,
+    CAREER_GOAL_OPTIONS, parse_menu_choices, parse_education_choice
+)
 from services.career_matcher import CareerMatcher
 from services.path_generator import PathGenerator
 from services.nlp_processor import NLPProcessor
@@ -31,78 +36,37 @@ class CareerRecommenderSystem:
         print("4. PhD")
         edu_choice = input("Select your education level (1-4): ")
         
-        education_map = {
-            "1": "High School",
-            "2": "Bachelor", 
-            "3": "Master",
-            "4": "PhD"
-        }
-        education_level = education_map.get(edu_choice, "Bachelor")
+        education_level = parse_education_choice(edu_choice)
         
         # Get skills
         print("\nAvailable Skills (enter numbers separated by commas):")
-        available_skills = [
-            "python", "java", "javascript", "sql", "html", "css",
-            "machine_learning", "data_analysis", "statistics", "excel",
-            "aws", "docker", "kubernetes", "react", "tableau", "powerbi",
-            "project_management", "communication", "leadership", "problem_solving"
-        ]
-        
-        for i, skill in enumerate(available_skills, 1):
+        for i, skill in enumerate(SKILL_OPTIONS, 1):
             print(f"{i}. {skill}")
         
         skill_choices = input("\nSelect your skills (e.g., 1,3,5): ")
-        selected_skills = []
-        for choice in skill_choices.split(','):
-            choice = choice.strip()
-            if choice.isdigit() and 1 <= int(choice) <= len(available_skills):
-                selected_skills.append(available_skills[int(choice) - 1])
+        selected_skills = parse_menu_choices(skill_choices, SKILL_OPTIONS, allow_names=False)
         
         # Get interests
         print("\nInterest Areas (enter numbers separated by commas):")
-        interest_areas = [
-            "technology", "data_science", "web_development", "artificial_intelligence",
-            "business", "design", "research", "healthcare", "education", "finance",
-            "gaming", "entrepreneurship", "cybersecurity", "cloud_computing"
-        ]
-        
-        for i, interest in enumerate(interest_areas, 1):
+        for i, interest in enumerate(INTEREST_OPTIONS, 1):
             print(f"{i}. {interest}")
         
         interest_choices = input("\nSelect your interests (e.g., 1,2,3): ")
-        selected_interests = []
-        for choice in interest_choices.split(','):
-            choice = choice.strip()
-            if choice.isdigit() and 1 <= int(choice) <= len(interest_areas):
-                selected_interests.append(interest_areas[int(choice) - 1])
+        selected_interests = parse_menu_choices(interest_choices, INTEREST_OPTIONS, allow_names=False)
         
         # Get career goals with options
         print("\nCareer Goal Options:")
-        career_goals = [
-            "Become a software developer/engineer",
-            "Pursue a career in data science/analysis",
-            "Work in artificial intelligence/machine learning",
-            "Become a web developer/frontend specialist",
-            "Pursue cloud computing/DevOps roles",
-            "Work in cybersecurity",
-            "Become a product/project manager",
-            "Pursue UX/UI design career",
-            "Start my own tech business",
-            "Work in research and development",
-            "Other (custom goal)"
-        ]
-        
-        for i, goal in enumerate(career_goals, 1):
+        for i, goal in enumerate(CAREER_GOAL_OPTIONS, 1):
             print(f"{i}. {goal}")
         
-        goal_choice = input("\nSelect your primary career goal (1-11): ")
+        goal_choice = input(f"\nSelect your primary career goal (1-{len(CAREER_GOAL_OPTIONS)}): ")
         
-        if goal_choice.isdigit() and 1 <= int(goal_choice) <= len(career_goals):
-            if int(goal_choice) == 11:
+        if goal_choice.isdigit() and 1 <= int(goal_choice) <= len(CAREER_GOAL_OPTIONS):
+            if int(goal_choice) == len(CAREER_GOAL_OPTIONS):
                 custom_goal = input("Enter your custom career goal: ")
                 goals = custom_goal
             else:
-                goals = career_goals[int(goal_choice) - 1]
+                goals = CAREER_GOAL_OPTIONS[int(goal_choice) - 1]
         else:
             goals = "Explore suitable career paths"
         
@@ -186,6 +150,47 @@ class CareerRecommenderSystem:
         
         print("\n Career exploration complete! Good luck on your journey!")
 
+def run_batch(args):
+    """Run recommendations for every profile in a JSON-lines or CSV file"""
+    from services.batch_processor import BatchProcessor
+    
+    processor = BatchProcessor(
+        careers_data_path=args.careers,
+        top_n=args.top_n,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        compact=args.compact,
+        n_features=args.n_features
+    )
+    summary = processor.run(args.input, args.output)
+    
+    print(f"Processed {summary['processed']} students "
+          f"({summary['failed']} failed) in {summary['elapsed_seconds']:.2f}s "
+          f"- {summary['students_per_second']:.1f} students/second")
+    print(f"Results written to {args.output}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Smart Career Path Recommender System")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    batch = subparsers.add_parser("batch", help="Recommend careers for a file of student profiles")
+    batch.add_argument("--input", required=True, help="Student profiles (.jsonl or .csv)")
+    batch.add_argument("--output", required=True, help="Where to write JSON-lines results")
+    batch.add_argument("--careers", default="data/careers.csv", help="Careers dataset")
+    batch.add_argument("--top-n", type=int, default=5, help="Recommendations per student")
+    batch.add_argument("--workers", type=int, default=1, help="Worker processes")
+    batch.add_argument("--chunk-size", type=int, default=100, help="Profiles per work unit")
+    batch.add_argument("--compact", action="store_true",
+                       help="Use hashed float32 features to cut per-worker memory")
+    batch.add_argument("--n-features", type=int, default=DEFAULT_N_FEATURES,
+                       help="Hashed feature columns in compact mode")
+    
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    system = CareerRecommenderSystem()
-    system.run_interactive_system()
\ No newline at end of file
+    args = parse_args()
+    if args.command == "batch":
+        run_batch(args)
+    else:
+        system = CareerRecommenderSystem()
+        system.run_interactive_system()
\ No newline at end of file
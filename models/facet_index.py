@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+EDUCATION_LEVELS = {
+    'High School': 1,
+    'Associate': 2,
+    'Bachelor': 3,
+    'Master': 4,
+    'PhD': 5
+}
+
+def parse_salary_ranges(salary_ranges):
+    """Parse "80,000-120,000" style ranges into (lower, upper) float arrays, NaN when unparsable"""
+    bounds = pd.Series(salary_ranges, dtype=object).astype(str).str.replace(',', '', regex=False)
+    parts = bounds.str.extract(r'^\s*(\d+(?:\.\d+)?)\s*(?:-\s*(\d+(?:\.\d+)?))?\s*$')
+    lower = pd.to_numeric(parts[0], errors='coerce').to_numpy(dtype=float)
+    upper = pd.to_numeric(parts[1], errors='coerce').to_numpy(dtype=float)
+    # A single figure is both bounds
+    upper = np.where(np.isnan(upper), lower, upper)
+    return lower, upper
+
+
+class FacetIndex:
+    """Precomputed career bitmaps per facet value plus a sorted salary index"""
+
+    FACETS = ('industry', 'growth_potential', 'education_level')
+
+    def __init__(self, careers_df):
+        self.size = len(careers_df)
+
+        # One boolean row mask per distinct value of each facet
+        self.bitmaps = {}
+        for facet in self.FACETS:
+            codes, values = pd.factorize(careers_df[facet])
+            self.bitmaps[facet] = {
+                value: codes == code for code, value in enumerate(values)
+            }
+
+        self.salary_min, self.salary_max = parse_salary_ranges(careers_df['salary_range'])
+        # Careers sorted by each salary bound; NaN sorts last and never matches
+        self._salary_order = np.argsort(self.salary_min, kind='stable')
+        self._salary_sorted = self.salary_min[self._salary_order]
+        self._salary_max_order = np.argsort(self.salary_max, kind='stable')
+        self._salary_max_sorted = self.salary_max[self._salary_max_order]
+
+    def facet_mask(self, facet, values):
+        """Careers whose facet equals any of the given values"""
+        if isinstance(values, str):
+            values = [values]
+        mask = np.zeros(self.size, dtype=bool)
+        for value in values:
+            bitmap = self.bitmaps[facet].get(value)
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def education_mask(self, max_education):
+        """Careers requiring at most the given education level"""
+        max_level = EDUCATION_LEVELS.get(max_education)
+        if max_level is None:
+            raise ValueError(f"Unknown education level: {max_education}")
+        return self.facet_mask('education_level', [
+            value for value in self.bitmaps['education_level']
+            if EDUCATION_LEVELS.get(value, 0) <= max_level
+        ])
+
+    def salary_mask(self, min_salary):
+        """Careers whose salary range starts at or above min_salary"""
+        start = np.searchsorted(self._salary_sorted, min_salary, side='left')
+        stop = np.searchsorted(self._salary_sorted, np.inf, side='right')
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self._salary_order[start:stop]] = True
+        return mask
+
+    def max_salary_mask(self, max_salary):
+        """Careers whose salary range ends at or below max_salary"""
+        stop = np.searchsorted(self._salary_max_sorted, max_salary, side='right')
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self._salary_max_order[:stop]] = True
+        return mask
+
+    def build_mask(self, industry=None, growth_potential=None, min_salary=None, max_education=None,
+                   max_salary=None):
+        """AND together the requested filters; None when no filter is given"""
+        masks = []
+        if industry is not None:
+            masks.append(self.facet_mask('industry', industry))
+        if growth_potential is not None:
+            masks.append(self.facet_mask('growth_potential', growth_potential))
+        if max_education is not None:
+            masks.append(self.education_mask(max_education))
+        if min_salary is not None:
+            masks.append(self.salary_mask(min_salary))
+        if max_salary is not None:
+            masks.append(self.max_salary_mask(max_salary))
+
+        if not masks:
+            return None
+        mask = masks[0]
+        for other in masks[1:]:
+            mask &= other
+        return mask
+
+    def candidates(self, **filters):
+        """Sorted career row indices matching all filters, or None when unfiltered"""
+        mask = self.build_mask(**filters)
+        return None if mask is None else np.flatnonzero(mask)
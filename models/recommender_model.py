@@ -1,83 +1,281 @@
+import itertools
 import pandas as pd
 import numpy as np
+from scipy.sparse import csr_matrix
 from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
 from sklearn.neighbors import NearestNeighbors
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import normalize
+from sklearn.utils import murmurhash3_32
+from models.facet_index import FacetIndex
+from models.sharded_scorer import ShardedScorer, top_k_indices
+from utils.instrumentation import metrics
+
+_snapshot_versions = itertools.count(1)
+DEFAULT_N_FEATURES = 2 ** 18
+_NO_CAREERS = np.array([], dtype=np.int32)
+
+def skill_id(skill):
+    """Stable non-negative int32 id for a skill name"""
+    return murmurhash3_32(skill, positive=True) & 0x7fffffff
+
+def ranking_agreement(exact, compact, profiles, k=10):
+    """Mean top-k overlap (0-1) between two recommenders over (skills, interests) profiles"""
+    overlaps = []
+    for skills, interests in profiles:
+        expected = {rec['career'] for rec in exact.recommend_careers(skills, interests, k)}
+        actual = {rec['career'] for rec in compact.recommend_careers(skills, interests, k)}
+        if expected:
+            overlaps.append(len(expected & actual) / len(expected))
+    return float(np.mean(overlaps)) if overlaps else 1.0
 
 class CareerRecommender:
-    def __init__(self):
+    def __init__(self, compact=False, n_features=DEFAULT_N_FEATURES):
+        """compact=True trades the exact TF-IDF vocabulary for a float32 hashed
+        feature space of n_features columns and int32 skill ids"""
+        self.compact = compact
+        self.n_features = n_features
         self.careers_df = None
         self.all_skills = []
+        self.skill_ids = None
+        self.required_skill_ids = None
+        self.required_skill_offsets = None
         self.tfidf_vectorizer = None
-        self.similarity_matrix = None
-        self.knn_model = None
+        self.career_matrix = None
+        self.facet_index = None
+        self._knn_model = None
+        self.snapshot_version = None
+        self.scorer = None
+        self._similarity_matrix = None
+        self._term_postings = None
+        self._skill_postings = None
+        
+    @property
+    def similarity_matrix(self):
+        """Career-to-career cosine similarities, computed on first use (O(n^2) memory)"""
+        if self._similarity_matrix is None and self.career_matrix is not None:
+            self._similarity_matrix = cosine_similarity(self.career_matrix)
+        return self._similarity_matrix
         
+    @property
+    def knn_model(self):
+        """Cosine nearest-neighbours model over the careers, fitted on first use"""
+        if self._knn_model is None and self.career_matrix is not None:
+            # The fitted model keeps its own copy of the matrix
+            self._knn_model = NearestNeighbors(n_neighbors=5, metric='cosine')
+            self._knn_model.fit(self.career_matrix)
+        return self._knn_model
+        
+    @metrics.timed('recommender.load_data')
     def load_data(self, careers_df):
         """Load career data and prepare models"""
         self.careers_df = careers_df
         
         # Extract all unique skills
-        all_skills_set = set()
-        for skills in careers_df['required_skills']:
-            all_skills_set.update(skills.split(','))
-        for skills in careers_df['preferred_skills']:
-            all_skills_set.update(skills.split(','))
-            
-        self.all_skills = sorted(list(all_skills_set))
+        if self.compact:
+            self._load_skill_ids(careers_df)
+        else:
+            all_skills_set = set()
+            for skills in careers_df['required_skills']:
+                all_skills_set.update(skills.split(','))
+            for skills in careers_df['preferred_skills']:
+                all_skills_set.update(skills.split(','))
+                
+            self.all_skills = sorted(list(all_skills_set))
         
         # Prepare TF-IDF features
-        career_descriptions = [
-            f"{row['required_skills']} {row['preferred_skills']} {row['industry']}"
-            for _, row in careers_df.iterrows()
-        ]
+        career_descriptions = (
+            careers_df['required_skills'] + ' ' +
+            careers_df['preferred_skills'] + ' ' +
+            careers_df['industry']
+        ).tolist()
+        
+        if self.compact:
+            self.tfidf_vectorizer = make_pipeline(
+                HashingVectorizer(n_features=self.n_features, alternate_sign=False,
+                                  norm=None, dtype=np.float32),
+                TfidfTransformer()
+            )
+        else:
+            self.tfidf_vectorizer = TfidfVectorizer()
+        with metrics.timer('recommender.tfidf_fit'):
+            tfidf_matrix = self.tfidf_vectorizer.fit_transform(career_descriptions)
+        
+        metrics.set_gauge('recommender.careers', tfidf_matrix.shape[0])
+        metrics.set_gauge('recommender.features', tfidf_matrix.shape[1])
+        metrics.set_gauge('recommender.skills',
+                          len(self.skill_ids) if self.compact else len(self.all_skills))
+        
+        # Keep the career matrix so queries don't re-vectorize the catalog;
+        # the similarity matrix and KNN model are built lazily
+        self.career_matrix = tfidf_matrix
+        self._similarity_matrix = None
+        self._knn_model = None
+        self._term_postings = None
+        self._skill_postings = None
+        self.facet_index = FacetIndex(careers_df)
+        self.snapshot_version = next(_snapshot_versions)
+        
+    def _load_skill_ids(self, careers_df):
+        """Store skills as int32 ids: a sorted catalog array and per-career required ids"""
+        required = careers_df['required_skills'].str.split(',')
+        preferred = careers_df['preferred_skills'].str.split(',')
+        
+        # Hash each distinct skill name once
+        codes, names = pd.factorize(required.explode())
+        ids = np.fromiter((skill_id(name) for name in names), dtype=np.int32, count=len(names))
+        self.required_skill_ids = ids[codes]
+        self.required_skill_offsets = np.concatenate(([0], np.cumsum(required.str.len()))).astype(np.int32)
+        
+        preferred_names = pd.unique(preferred.explode())
+        preferred_ids = np.fromiter((skill_id(name) for name in preferred_names),
+                                    dtype=np.int32, count=len(preferred_names))
+        self.skill_ids = np.union1d(ids, preferred_ids).astype(np.int32)
+        self.all_skills = []
+        
+    @property
+    def idf(self):
+        """IDF weight per feature column"""
+        return self.tfidf_vectorizer[-1].idf_ if self.compact else self.tfidf_vectorizer.idf_
+        
+    @property
+    def term_postings(self):
+        """Career matrix in CSC form: column t lists the careers containing term t"""
+        if self._term_postings is None and self.career_matrix is not None:
+            self._term_postings = self.career_matrix.tocsc()
+        return self._term_postings
         
-        self.tfidf_vectorizer = TfidfVectorizer()
-        tfidf_matrix = self.tfidf_vectorizer.fit_transform(career_descriptions)
+    def term_counts(self, text):
+        """Raw term counts of text as {feature column: count}, before TF-IDF weighting"""
+        if self.compact:
+            counts = self.tfidf_vectorizer[0].transform([text])
+            return dict(zip(counts.indices.tolist(), counts.data.tolist()))
         
-        # Build similarity matrix
-        self.similarity_matrix = cosine_similarity(tfidf_matrix)
+        vocabulary = self.tfidf_vectorizer.vocabulary_
+        counts = {}
+        for token in self.tfidf_vectorizer.build_analyzer()(text):
+            column = vocabulary.get(token)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+        return counts
         
-        # Train KNN model
-        self.knn_model = NearestNeighbors(n_neighbors=5, metric='cosine')
-        self.knn_model.fit(tfidf_matrix)
+    def vector_from_counts(self, counts):
+        """Unit-length TF-IDF query row from {feature column: count}, equal to transform() of the text"""
+        columns = np.array(sorted(counts), dtype=np.int64)
+        dtype = self.career_matrix.dtype
+        values = np.array([counts[column] for column in columns], dtype=dtype)
+        values *= np.asarray(self.idf, dtype=dtype)[columns]
+        vector = csr_matrix((values, columns, [0, len(columns)]), shape=(1, self.career_matrix.shape[1]))
+        return normalize(vector)
         
-    def recommend_careers(self, student_skills, student_interests, top_n=5):
-        """Recommend careers based on student profile"""
+    def careers_requiring(self, skill):
+        """Row indices of careers listing skill as required (repeated if listed twice)"""
+        if self._skill_postings is None:
+            self._skill_postings = self._build_skill_postings()
+        key = skill_id(skill) if self.compact else skill
+        return self._skill_postings.get(key, _NO_CAREERS)
+        
+    @property
+    def required_skill_counts(self):
+        """Number of required skills per career"""
+        if self.compact:
+            return np.diff(self.required_skill_offsets)
+        return self.careers_df['required_skills'].str.count(',').to_numpy() + 1
+        
+    def _build_skill_postings(self):
+        """Map each required skill (name, or id in compact mode) to the careers listing it"""
+        if self.compact:
+            keys = self.required_skill_ids
+            lengths = np.diff(self.required_skill_offsets)
+        else:
+            required = self.careers_df['required_skills'].str.split(',')
+            keys = np.array(list(itertools.chain.from_iterable(required)), dtype=object)
+            lengths = required.str.len().to_numpy()
+        rows = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+        
+        codes, uniques = pd.factorize(keys)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        return {
+            key: rows[order[bounds[i]:bounds[i + 1]]]
+            for i, key in enumerate(uniques)
+        }
+        
+    def enable_sharded_scoring(self, n_workers=None, start_method=None):
+        """Score queries across worker processes sharing the career matrix"""
+        if self.career_matrix is None:
+            raise ValueError("Data not loaded. Call load_data() first.")
+        if self.scorer is None:
+            self.scorer = ShardedScorer(self, n_workers, start_method)
+        self.scorer.start()
+        return self.scorer
+    
+    def close(self):
+        """Stop sharded scoring workers, if any"""
+        if self.scorer is not None:
+            self.scorer.close()
+            self.scorer = None
+        
+    @metrics.timed('recommender.recommend_careers')
+    def recommend_careers(self, student_skills, student_interests, top_n=5, candidates=None):
+        """Recommend careers based on student profile.
+        
+        candidates optionally restricts scoring to career row indices (an
+        array or list), e.g. from facet_index.candidates(...).
+        """
         if self.careers_df is None:
             raise ValueError("Data not loaded. Call load_data() first.")
+        if candidates is not None:
+            # Sorted unique int64 rows for fancy indexing and shard splitting
+            candidates = np.unique(np.asarray(candidates, dtype=np.int64))
             
         # Create student profile vector
         student_profile = ' '.join(student_skills + student_interests)
         student_vector = self.tfidf_vectorizer.transform([student_profile])
         
-        # Calculate similarities
-        similarities = cosine_similarity(student_vector, self.tfidf_vectorizer.transform([
-            f"{row['required_skills']} {row['preferred_skills']} {row['industry']}"
-            for _, row in self.careers_df.iterrows()
-        ]))
-        
         # Get top recommendations
-        top_indices = similarities[0].argsort()[-top_n:][::-1]
+        if candidates is not None and len(candidates) == 0:
+            return []
+        if self.scorer is not None:
+            top_indices, scores = self.scorer.top_k(student_vector, top_n, candidates)
+        else:
+            # Only the candidate rows are scored. Career rows and the query have
+            # unit L2 norm, so dot products are cosine similarities, computed
+            # the same way as in the sharded workers.
+            rows = self.career_matrix if candidates is None else self.career_matrix[candidates]
+            similarities = (rows @ student_vector.T).toarray().ravel()
+            top_local = top_k_indices(similarities, top_n)
+            top_indices = top_local if candidates is None else candidates[top_local]
+            scores = similarities[top_local]
         
-        recommendations = []
-        for idx in top_indices:
-            career = self.careers_df.iloc[idx]
-            score = similarities[0][idx]
-            
-            # Calculate skill match percentage
-            required_skills = career['required_skills'].split(',')
-            matched_skills = [skill for skill in required_skills if skill in student_skills]
-            skill_match = len(matched_skills) / len(required_skills) if required_skills else 0
-            
-            recommendations.append({
-                'career': career['career_title'],
-                'similarity_score': round(score, 3),
-                'skill_match_percentage': round(skill_match * 100, 1),
-                'industry': career['industry'],
-                'growth_potential': career['growth_potential'],
-                'salary_range': career['salary_range'],
-                'education_level': career['education_level'],
-                'missing_skills': [skill for skill in required_skills if skill not in student_skills]
-            })
-            
-        return recommendations
\ No newline at end of file
+        return [
+            self.build_recommendation(idx, score, student_skills)
+            for idx, score in zip(top_indices, scores)
+        ]
+        
+    def build_recommendation(self, idx, score, student_skills, matched_count=None):
+        """Describe career row idx for a student with the given similarity score.
+        
+        matched_count, when known, is how many of the career's required
+        skills the student has, and saves recounting them.
+        """
+        career = self.careers_df.iloc[idx]
+        
+        # Calculate skill match percentage
+        required_skills = career['required_skills'].split(',')
+        if matched_count is None:
+            matched_count = len([skill for skill in required_skills if skill in student_skills])
+        skill_match = matched_count / len(required_skills) if required_skills else 0
+        
+        return {
+            'career': career['career_title'],
+            # Plain floats keep results JSON-serializable for float32 matrices
+            'similarity_score': round(float(score), 3),
+            'skill_match_percentage': round(skill_match * 100, 1),
+            'industry': career['industry'],
+            'growth_potential': career['growth_potential'],
+            'salary_range': career['salary_range'],
+            'education_level': career['education_level'],
+            'missing_skills': [skill for skill in required_skills if skill not in student_skills]
+        }
\ No newline at end of file
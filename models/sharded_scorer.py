@@ -0,0 +1,259 @@
+"""Multi-process top-k scoring over a career matrix held in shared memory.
+
+The CSR career matrix of a CareerRecommender is split into contiguous row
+shards. Each shard's data/indices/indptr arrays are copied once into
+multiprocessing.shared_memory blocks, and every worker process attaches to
+its shard without copying it. Workers share the parent's resource tracker,
+so only the parent decides when blocks are unlinked. A query is sent to
+all workers, each returns its local top-k, and the parent merges them.
+
+When the recommender reloads its data the scorer publishes the new matrix,
+tells the workers to re-attach, and only then releases the old blocks.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+def top_k_indices(scores, k):
+    """Indices of the k highest scores, highest first; ties go to the lowest index"""
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind='stable')
+    # argpartition picks arbitrary rows among ties at the cut-off, so take
+    # every row above the k-th score and then the lowest tied rows
+    threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+    above = np.flatnonzero(scores > threshold)
+    tied = np.flatnonzero(scores == threshold)[:k - len(above)]
+    top = np.concatenate((above, tied))
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
+def _worker_main(worker_id, task_queue, result_queue):
+    blocks = []
+    shard = None
+    row_start = 0
+
+    while True:
+        message = task_queue.get()
+        command = message[0]
+
+        if command == 'stop':
+            break
+
+        if command == 'attach':
+            _, version, spec = message
+            shard = None
+            for block in blocks:
+                block.close()
+            blocks = []
+            arrays = []
+            for name, dtype, length in spec['arrays']:
+                block = shared_memory.SharedMemory(name=name)
+                blocks.append(block)
+                arrays.append(np.ndarray((length,), dtype=dtype, buffer=block.buf))
+            data, indices, indptr = arrays
+            shard = csr_matrix((data, indices, indptr), shape=spec['shape'], copy=False)
+            row_start = spec['row_start']
+            result_queue.put(('attached', version, worker_id))
+
+        elif command == 'score':
+            _, request_id, query_indices, query_values, k, candidates = message
+            query = csr_matrix(
+                (query_values, query_indices, [0, len(query_indices)]),
+                shape=(1, shard.shape[1])
+            )
+            if candidates is not None:
+                # candidates are this shard's own sorted local rows; only they are scored
+                scores = (shard[candidates] @ query.T).toarray().ravel()
+                best = top_k_indices(scores, min(k, len(candidates)))
+                top, scores = candidates[best], scores[best]
+            else:
+                scores = (shard @ query.T).toarray().ravel()
+                top = top_k_indices(scores, min(k, len(scores)))
+                scores = scores[top]
+            result_queue.put(('scores', request_id, top + row_start, scores))
+
+    shard = None
+    for block in blocks:
+        block.close()
+
+
+def _shutdown(workers, segments):
+    for process, task_queue in workers:
+        if process.is_alive():
+            task_queue.put(('stop',))
+    for process, _ in workers:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    workers.clear()
+    _release(segments)
+
+
+def _release(segments):
+    for block in segments:
+        block.close()
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+class ShardedScorer:
+    """Fans cosine top-k queries out to worker processes, one row shard each"""
+
+    def __init__(self, recommender, n_workers=None, start_method=None):
+        self.recommender = recommender
+        self.n_workers = max(1, n_workers or os.cpu_count() or 1)
+        self._context = multiprocessing.get_context(start_method)
+        self._result_queue = None
+        self._workers = []
+        self._segments = []
+        self._version = None
+        self._bounds = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _shutdown, self._workers, self._segments)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def running(self):
+        return bool(self._workers)
+
+    def start(self):
+        """Start the worker processes and publish the current career matrix"""
+        with self._lock:
+            if not self._workers:
+                # Start the tracker before the workers so they inherit it
+                # rather than each spawning one that would unlink our blocks
+                resource_tracker.ensure_running()
+                self._result_queue = self._context.Queue()
+                for worker_id in range(self.n_workers):
+                    task_queue = self._context.Queue()
+                    process = self._context.Process(
+                        target=_worker_main,
+                        args=(worker_id, task_queue, self._result_queue),
+                        daemon=True
+                    )
+                    process.start()
+                    self._workers.append((process, task_queue))
+                self._version = None
+            self._sync()
+
+    def close(self):
+        """Stop the workers and release all shared memory"""
+        with self._lock:
+            _shutdown(self._workers, self._segments)
+            self._version = None
+
+    def _sync(self):
+        """Publish a new snapshot if the recommender reloaded its data"""
+        if self._version == self.recommender.snapshot_version:
+            return
+
+        matrix = self.recommender.career_matrix.tocsr()
+        bounds = np.linspace(0, matrix.shape[0], len(self._workers) + 1).astype(int)
+        old_segments = list(self._segments)
+        new_segments = []
+        version = self.recommender.snapshot_version
+
+        try:
+            self._publish(matrix, bounds, version, new_segments)
+        except BaseException:
+            _release(new_segments)
+            raise
+
+        # Every worker now points at the new blocks, so the old ones can go
+        self._segments[:] = new_segments
+        _release(old_segments)
+        self._bounds = bounds
+        self._version = version
+
+    def _publish(self, matrix, bounds, version, new_segments):
+        """Copy each row shard into shared memory and wait for the workers to attach"""
+        for (process, task_queue), row_start, row_stop in zip(self._workers, bounds[:-1], bounds[1:]):
+            shard = matrix[row_start:row_stop]
+            arrays = []
+            for array in (shard.data, shard.indices, shard.indptr):
+                block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+                new_segments.append(block)
+                arrays.append((block.name, array.dtype.str, len(array)))
+            task_queue.put(('attach', version, {
+                'arrays': arrays,
+                'shape': shard.shape,
+                'row_start': int(row_start)
+            }))
+
+        for _ in self._replies('attached', version):
+            pass
+
+    def _replies(self, kind, tag):
+        """Yield one matching reply per worker, failing if a worker has died"""
+        pending = len(self._workers)
+        while pending:
+            try:
+                reply = self._result_queue.get(timeout=1)
+            except queue.Empty:
+                if not all(process.is_alive() for process, _ in self._workers):
+                    raise RuntimeError("A scoring worker exited unexpectedly")
+                continue
+            # Replies are tagged with the snapshot version or request id
+            if reply[0] == kind and reply[1] == tag:
+                pending -= 1
+                yield reply
+
+    def _shard_candidates(self, candidates, worker):
+        """The part of a sorted candidate array in a worker's shard, as local rows"""
+        if candidates is None:
+            return None
+        row_start, row_stop = self._bounds[worker], self._bounds[worker + 1]
+        start, stop = np.searchsorted(candidates, [row_start, row_stop])
+        return np.asarray(candidates[start:stop], dtype=np.int64) - row_start
+
+    def top_k(self, query_vector, k, candidates=None):
+        """Return (career indices, scores) of the k best matches, best first.
+
+        query_vector is a 1 x n_features sparse row with unit L2 norm, as
+        produced by the recommender's vectorizer, so dot products equal
+        cosine similarities. candidates optionally restricts scoring to a
+        sorted array of career row indices.
+        """
+        query = query_vector.tocsr()
+
+        with self._lock:
+            if not self._workers:
+                raise RuntimeError("ShardedScorer is not running. Call start() first.")
+            self._sync()
+
+            self._request_id += 1
+            request_id = self._request_id
+            for worker, (_, task_queue) in enumerate(self._workers):
+                task_queue.put(('score', request_id, query.indices, query.data, k,
+                                self._shard_candidates(candidates, worker)))
+
+            indices, scores = [], []
+            for reply in self._replies('scores', request_id):
+                indices.append(reply[2])
+                scores.append(reply[3])
+
+        indices = np.concatenate(indices)
+        scores = np.concatenate(scores)
+        # Same ordering as top_k_indices: score descending, then row index
+        order = np.lexsort((indices, -scores))[:k]
+        return indices[order], scores[order]
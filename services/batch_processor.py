@@ -0,0 +1,153 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from models.recommender_model import DEFAULT_N_FEATURES
+from services.career_matcher import CareerMatcher
+from services.path_generator import PathGenerator
+from services.profile_manager import ProfileManager, parse_student_id
+
+def read_profiles(input_path):
+    """Stream student records from a JSON-lines or CSV file.
+
+    JSON lines are yielded unparsed and decoded by parse_record, so one bad
+    line is reported as a failed record instead of ending the run.
+    """
+    with open(input_path, 'r', newline='') as f:
+        if os.path.splitext(input_path)[1].lower() == '.csv':
+            for record in csv.DictReader(f):
+                yield record
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+def parse_record(record):
+    """Decode a JSON line into a record dict, raising ValueError for anything else"""
+    if isinstance(record, str):
+        record = json.loads(record)
+    if not isinstance(record, dict):
+        raise ValueError(f"Expected a JSON object, got {type(record).__name__}")
+    return record
+
+def _chunks(records, chunk_size):
+    """Yield (start_index, records) chunks without materializing the input"""
+    start = 0
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+class BatchRecommender:
+    """Runs matching and learning-path generation for one chunk of records"""
+
+    def __init__(self, careers_data_path, top_n=5, compact=False, n_features=DEFAULT_N_FEATURES):
+        self.career_matcher = CareerMatcher(careers_data_path, compact=compact, n_features=n_features)
+        self.path_generator = PathGenerator(careers_data_path)
+        self.top_n = top_n
+
+    def process_record(self, record, profile_manager, default_id):
+        """Build the recommendation result for a single record"""
+        student = profile_manager.create_student_from_record(record, default_id)
+        recommendations = self.career_matcher.find_career_matches(student, top_n=self.top_n)
+
+        learning_path = None
+        if recommendations:
+            learning_path = self.path_generator.generate_learning_path(
+                student, recommendations[0]['career']
+            )
+
+        return {
+            'student': student.to_dict(),
+            'recommendations': recommendations,
+            'learning_path': learning_path
+        }
+
+    def process_chunk(self, start, records):
+        """Process a chunk of raw records, reporting per-record errors instead of raising"""
+        # A fresh manager per chunk keeps finished students from accumulating
+        profile_manager = ProfileManager()
+        results = []
+        for offset, record in enumerate(records):
+            default_id = start + offset + 1
+            try:
+                record = parse_record(record)
+                results.append(self.process_record(record, profile_manager, default_id))
+            except Exception as e:
+                student_id = record.get('student_id') if isinstance(record, dict) else None
+                results.append({
+                    'student': {'student_id': parse_student_id(student_id, default_id)},
+                    'error': str(e)
+                })
+        return results
+
+
+_worker_recommender = None
+
+def _init_worker(careers_data_path, top_n, compact, n_features):
+    global _worker_recommender
+    _worker_recommender = BatchRecommender(careers_data_path, top_n, compact, n_features)
+
+def _process_chunk_in_worker(start, records):
+    return _worker_recommender.process_chunk(start, records)
+
+
+class BatchProcessor:
+    def __init__(self, careers_data_path='data/careers.csv', top_n=5, workers=1, chunk_size=100,
+                 compact=False, n_features=DEFAULT_N_FEATURES):
+        """compact=True gives every worker a compact-mode recommender"""
+        self.careers_data_path = careers_data_path
+        self.top_n = top_n
+        self.compact = compact
+        self.n_features = n_features
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+
+    def run(self, input_path, output_path):
+        """Stream profiles from input_path and write one JSON result per line to output_path"""
+        summary = {'processed': 0, 'failed': 0}
+        start_time = time.perf_counter()
+
+        with open(output_path, 'w') as out:
+            for results in self._iter_results(read_profiles(input_path)):
+                for result in results:
+                    out.write(json.dumps(result) + '\n')
+                    summary['processed'] += 1
+                    if 'error' in result:
+                        summary['failed'] += 1
+                out.flush()
+
+        summary['elapsed_seconds'] = time.perf_counter() - start_time
+        summary['students_per_second'] = (
+            summary['processed'] / summary['elapsed_seconds'] if summary['elapsed_seconds'] else 0.0
+        )
+        return summary
+
+    def _iter_results(self, records):
+        """Yield result chunks in input order, keeping at most 2 chunks per worker in flight"""
+        chunks = _chunks(records, self.chunk_size)
+
+        if self.workers == 1:
+            recommender = BatchRecommender(self.careers_data_path, self.top_n, self.compact, self.n_features)
+            for start, chunk in chunks:
+                yield recommender.process_chunk(start, chunk)
+            return
+
+        max_in_flight = self.workers * 2
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=(self.careers_data_path, self.top_n,
+                                           self.compact, self.n_features)) as executor:
+            pending = []
+            for start, chunk in chunks:
+                pending.append(executor.submit(_process_chunk_in_worker, start, chunk))
+                if len(pending) >= max_in_flight:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
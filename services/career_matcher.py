@@ -1,19 +1,54 @@
 import pandas as pd
-from models.recommender_model import CareerRecommender
+from models.facet_index import EDUCATION_LEVELS
+from models.recommender_model import DEFAULT_N_FEATURES, CareerRecommender
+from utils.instrumentation import metrics
 
 class CareerMatcher:
-    def __init__(self, careers_data_path):
-        self.careers_df = pd.read_csv(careers_data_path)
-        self.recommender = CareerRecommender()
+    def __init__(self, careers_data_path, instrument=None, scoring_workers=None,
+                 compact=False, n_features=DEFAULT_N_FEATURES):
+        """compact and n_features select the recommender's compact feature mode"""
+        metrics.configure(instrument)
+        
+        with metrics.timer('career_matcher.load_csv'):
+            self.careers_df = pd.read_csv(careers_data_path)
+        metrics.set_gauge('career_matcher.careers', len(self.careers_df))
+        
+        self.recommender = CareerRecommender(compact=compact, n_features=n_features)
         self.recommender.load_data(self.careers_df)
+        if scoring_workers:
+            self.recommender.enable_sharded_scoring(scoring_workers)
+        
+    def close(self):
+        """Release scoring workers held by the recommender"""
+        self.recommender.close()
+        
+    @metrics.profiled('career_matcher.find_career_matches')
+    @metrics.timed('career_matcher.find_career_matches')
+    def find_career_matches(self, student, top_n=5, industry=None, growth_potential=None,
+                            min_salary=None, max_education=None, max_salary=None):
+        """Find career matches for a student.
         
-    def find_career_matches(self, student, top_n=5):
-        """Find career matches for a student"""
+        Optional filters are applied before scoring and ANDed together:
+        industry and growth_potential take a value or list of values, and
+        max_education keeps careers requiring at most that level. Salary
+        filters compare against the bounds of the career's salary range:
+        min_salary is a floor on the range's start ("80,000-120,000" passes
+        min_salary=80000 but not 90000), and max_salary a ceiling on its end.
+        """
+        candidates = self.recommender.facet_index.candidates(
+            industry=industry,
+            growth_potential=growth_potential,
+            min_salary=min_salary,
+            max_education=max_education,
+            max_salary=max_salary
+        )
         recommendations = self.recommender.recommend_careers(
-            student.skills, student.interests, top_n
+            student.skills, student.interests, top_n, candidates
         )
-        
-        # Add education compatibility
+        return self.score_recommendations(student, recommendations)
+    
+    def score_recommendations(self, student, recommendations):
+        """Add education compatibility and overall scores, best first"""
         for rec in recommendations:
             education_score = self._calculate_education_compatibility(
                 student.education_level, rec['education_level']
@@ -31,16 +66,8 @@ class CareerMatcher:
     
     def _calculate_education_compatibility(self, student_edu, career_edu):
         """Calculate education level compatibility"""
-        education_levels = {
-            'High School': 1,
-            'Associate': 2,
-            'Bachelor': 3,
-            'Master': 4,
-            'PhD': 5
-        }
-        
-        student_level = education_levels.get(student_edu, 0)
-        career_level = education_levels.get(career_edu, 0)
+        student_level = EDUCATION_LEVELS.get(student_edu, 0)
+        career_level = EDUCATION_LEVELS.get(career_edu, 0)
         
         if student_level >= career_level:
             return 1.0
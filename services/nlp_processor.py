@@ -1,6 +1,7 @@
 import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import re
+from utils.instrumentation import metrics
 
 # Download required NLTK data
 try:
@@ -14,10 +15,12 @@ except LookupError:
     nltk.download('vader_lexicon')
 
 class NLPProcessor:
-    def __init__(self):
+    def __init__(self, instrument=None):
+        metrics.configure(instrument)
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
         print("✅ NLP Processor initialized successfully (NLTK only)")
     
+    @metrics.timed('nlp.analyze_feedback_sentiment')
     def analyze_feedback_sentiment(self, feedback_text):
         """Analyze sentiment of user feedback using NLTK"""
         try:
@@ -41,6 +44,7 @@ class NLPProcessor:
                 'error': str(e)
             }
     
+    @metrics.timed('nlp.extract_skills_from_text')
     def extract_skills_from_text(self, text):
         """Extract potential skills from text using keyword matching"""
         try:
@@ -68,6 +72,7 @@ class NLPProcessor:
             print(f"Error extracting skills: {e}")
             return []
     
+    @metrics.timed('nlp.calculate_text_similarity')
     def calculate_text_similarity(self, text1, text2):
         """Calculate similarity between two texts using word overlap"""
         try:
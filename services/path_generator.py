@@ -1,9 +1,23 @@
+import os
 import pandas as pd
+from services.resource_catalog import ResourceCatalog
+from utils.instrumentation import metrics
 
 class PathGenerator:
-    def __init__(self, careers_data_path):
-        self.careers_df = pd.read_csv(careers_data_path)
+    RESOURCES_PER_SKILL = 3
+
+    def __init__(self, careers_data_path, resources_data_path=None, instrument=None):
+        metrics.configure(instrument)
+        
+        with metrics.timer('path_generator.load_csv'):
+            self.careers_df = pd.read_csv(careers_data_path)
+        if resources_data_path is None:
+            resources_data_path = os.path.join(
+                os.path.dirname(careers_data_path), 'learning_resources.json'
+            )
+        self.resource_catalog = ResourceCatalog.from_file(resources_data_path)
         
+    @metrics.timed('path_generator.generate_learning_path')
     def generate_learning_path(self, student, target_career, timeframe_months=12):
         """Generate personalized learning path to target career"""
         career_data = self.careers_df[
@@ -60,24 +74,6 @@ class PathGenerator:
     
     def _get_learning_resources(self, skills):
         """Get learning resources for skills"""
-        resource_map = {
-            'python': ['Python.org tutorial', 'Codecademy Python', 'Real Python articles'],
-            'machine_learning': ['Coursera ML course', 'Fast.ai', 'Kaggle tutorials'],
-            'sql': ['SQLZoo', 'Mode Analytics SQL tutorial', 'LeetCode SQL problems'],
-            'javascript': ['MDN JavaScript guide', 'FreeCodeCamp JavaScript', 'Eloquent JavaScript'],
-            'aws': ['AWS Training', 'AWS Whitepapers', 'Cloud Guru courses'],
-            'data_analysis': ['DataCamp', 'Towards Data Science', 'Kaggle notebooks'],
-            'java': ['Oracle Java Tutorials', 'Codecademy Java', 'Java for Beginners'],
-            'react': ['React Official Tutorial', 'FreeCodeCamp React', 'React Documentation'],
-            'docker': ['Docker Getting Started', 'Docker Documentation', 'Docker Tutorials'],
-            'kubernetes': ['Kubernetes Basics', 'K8s Documentation', 'Kubernetes Tutorials'],
-            'statistics': ['Khan Academy Statistics', 'Coursera Statistics', 'StatQuest YouTube'],
-            'tableau': ['Tableau Training', 'Tableau Tutorials', 'Tableau Public Gallery'],
-            'excel': ['Microsoft Excel Help', 'Excel Easy', 'Chandoo Excel Tutorials']
-        }
-        
-        resources = {}
-        for skill in skills:
-            resources[skill] = resource_map.get(skill, ['Online tutorials', 'Documentation', 'Practice projects'])
-            
-        return resources
\ No newline at end of file
+        return self.resource_catalog.get_resources_bulk(
+            skills, page_size=self.RESOURCES_PER_SKILL
+        )
@@ -1,15 +1,120 @@
 from models.student import Student
+from services.resource_catalog import normalize_skill
+from services.scoring_session import ScoringSession
+
+EDUCATION_OPTIONS = {
+    "1": "High School",
+    "2": "Bachelor",
+    "3": "Master",
+    "4": "PhD"
+}
+
+SKILL_OPTIONS = [
+    "python", "java", "javascript", "sql", "html", "css",
+    "machine_learning", "data_analysis", "statistics", "excel",
+    "aws", "docker", "kubernetes", "react", "tableau", "powerbi",
+    "project_management", "communication", "leadership", "problem_solving"
+]
+
+INTEREST_OPTIONS = [
+    "technology", "data_science", "web_development", "artificial_intelligence",
+    "business", "design", "research", "healthcare", "education", "finance",
+    "gaming", "entrepreneurship", "cybersecurity", "cloud_computing"
+]
+
+# The last option asks for a custom goal
+CAREER_GOAL_OPTIONS = [
+    "Become a software developer/engineer",
+    "Pursue a career in data science/analysis",
+    "Work in artificial intelligence/machine learning",
+    "Become a web developer/frontend specialist",
+    "Pursue cloud computing/DevOps roles",
+    "Work in cybersecurity",
+    "Become a product/project manager",
+    "Pursue UX/UI design career",
+    "Start my own tech business",
+    "Work in research and development",
+    "Other (custom goal)"
+]
+
+DEFAULT_EDUCATION = "Bachelor"
+DEFAULT_GOAL = "Explore suitable career paths"
+
+def parse_menu_choices(choices, options, allow_names=True):
+    """Map menu numbers like "1,3,5" (or a list) to option values.
+
+    With allow_names, free-text names are normalized to option-style ids
+    ("Machine Learning" -> "machine_learning").
+    """
+    if choices is None:
+        items = []
+    elif isinstance(choices, str):
+        items = choices.split(',')
+    else:
+        items = choices
+
+    selected = []
+    for choice in items:
+        choice = str(choice).strip()
+        if choice.isdigit():
+            if 1 <= int(choice) <= len(options):
+                selected.append(options[int(choice) - 1])
+        elif choice and allow_names:
+            selected.append(normalize_skill(choice))
+    return selected
+
+def parse_education_choice(choice):
+    """Map an education menu number or level name to an education level"""
+    choice = str(choice).strip() if choice is not None else ""
+    if choice in EDUCATION_OPTIONS:
+        return EDUCATION_OPTIONS[choice]
+    if choice in EDUCATION_OPTIONS.values():
+        return choice
+    return DEFAULT_EDUCATION
+
+def parse_goal_choice(choice, custom_goal=None):
+    """Map a career goal menu number or free-text goal to a goal string"""
+    choice = str(choice).strip() if choice is not None else ""
+    if choice.isdigit():
+        if 1 <= int(choice) < len(CAREER_GOAL_OPTIONS):
+            return CAREER_GOAL_OPTIONS[int(choice) - 1]
+        if int(choice) == len(CAREER_GOAL_OPTIONS) and custom_goal:
+            return custom_goal
+        return DEFAULT_GOAL
+    return choice or DEFAULT_GOAL
+
+def parse_student_id(value, default_id=None):
+    """Normalize a record's student id: numeric strings become ints, blanks use default_id"""
+    if isinstance(value, str):
+        value = value.strip()
+        if value.isdigit():
+            return int(value)
+    return value if value not in (None, '') else default_id
 
 class ProfileManager:
     def __init__(self):
         self.students = {}
+        self.sessions = {}
         
     def create_student_profile(self, student_id, name, education_level, skills, interests, goals):
         """Create a new student profile"""
         student = Student(student_id, name, education_level, skills, interests, goals)
         self.students[student_id] = student
+        # A session for the replaced profile would keep scoring the old Student
+        self.sessions.pop(student_id, None)
         return student
     
+    def create_student_from_record(self, record, default_id=None):
+        """Create a student profile from a batch record (menu numbers or free text)"""
+        return self.create_student_profile(
+            student_id=parse_student_id(record.get('student_id'), default_id),
+            name=record.get('name', ''),
+            education_level=parse_education_choice(record.get('education_level', record.get('education'))),
+            skills=parse_menu_choices(record.get('skills'), SKILL_OPTIONS),
+            interests=parse_menu_choices(record.get('interests'), INTEREST_OPTIONS),
+            goals=parse_goal_choice(record.get('goals', record.get('goal')), record.get('custom_goal'))
+        )
+    
     def get_student(self, student_id):
         """Retrieve student profile"""
         return self.students.get(student_id)
@@ -17,10 +122,60 @@ class ProfileManager:
     def update_student_skills(self, student_id, new_skills):
         """Update student skills"""
         if student_id in self.students:
-            self.students[student_id].skills = new_skills
+            session = self._session_for(student_id)
+            if session is not None:
+                session.set_skills(new_skills)
+            else:
+                self.students[student_id].skills = new_skills
             return True
         return False
     
+    def open_scoring_session(self, student_id, career_matcher, top_n=5):
+        """Keep a student's recommendations current across skill updates"""
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        session = ScoringSession(career_matcher, student, top_n)
+        self.sessions[student_id] = session
+        return session
+    
+    def close_scoring_session(self, student_id):
+        """Stop tracking a student's recommendations"""
+        self.sessions.pop(student_id, None)
+    
+    def _session_for(self, student_id):
+        """The open session for a student, dropped if it tracks a replaced Student object"""
+        session = self.sessions.get(student_id)
+        if session is not None and session.student is not self.students.get(student_id):
+            del self.sessions[student_id]
+            return None
+        return session
+    
+    def add_student_skill(self, student_id, skill):
+        """Add one skill, returning the careers whose rank changed (None for unknown students)"""
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        session = self._session_for(student_id)
+        if session is not None:
+            return session.add_skill(skill)
+        student.skills = student.skills + [skill]
+        return []
+    
+    def remove_student_skill(self, student_id, skill):
+        """Remove one skill, returning the careers whose rank changed (None for unknown students)"""
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        session = self._session_for(student_id)
+        if session is not None:
+            return session.remove_skill(skill)
+        if skill in student.skills:
+            skills = list(student.skills)
+            skills.remove(skill)
+            student.skills = skills
+        return []
+    
     def analyze_student_profile(self, student):
         """Analyze student profile completeness"""
         analysis = {
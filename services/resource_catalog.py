@@ -0,0 +1,115 @@
+import json
+import os
+import re
+from utils.instrumentation import metrics
+
+DEFAULT_RESOURCES = ('Online tutorials', 'Documentation', 'Practice projects')
+
+_SEPARATORS = re.compile(r'[\s\-/]+')
+
+
+def normalize_skill(skill):
+    """Normalize a skill name to its catalog id (e.g. 'Machine Learning' -> 'machine_learning')"""
+    return _SEPARATORS.sub('_', str(skill).strip().lower()).strip('_')
+
+
+class ResourceCatalog:
+    """Ranked learning resources indexed by normalized skill id"""
+
+    _cache = {}
+
+    def __init__(self, resources, aliases=None, default_resources=DEFAULT_RESOURCES):
+        self.aliases = {
+            normalize_skill(alias): normalize_skill(target)
+            for alias, target in (aliases or {}).items()
+        }
+        self.default_resources = tuple(default_resources)
+
+        # Each skill id maps to a tuple of titles sorted by rank once, so
+        # lookups and pagination are plain slices. Keys that normalize to the
+        # same id are merged before sorting; ties keep file order.
+        merged = {}
+        order = 0
+        for skill, entries in resources.items():
+            ranked = merged.setdefault(normalize_skill(skill), [])
+            for position, entry in enumerate(entries):
+                if isinstance(entry, dict):
+                    ranked.append((entry.get('rank', position + 1), order, entry['title']))
+                else:
+                    ranked.append((position + 1, order, entry))
+                order += 1
+        self._index = {}
+        for skill_id, ranked in merged.items():
+            ranked.sort()
+            self._index[skill_id] = tuple(title for _, _, title in ranked)
+
+    @classmethod
+    def from_file(cls, filepath):
+        """Load a catalog from JSON, reusing the parsed index while the file is unchanged"""
+        key = os.path.abspath(filepath)
+        try:
+            mtime = os.path.getmtime(key)
+        except OSError:
+            print(f"Learning resources file not found: {filepath}")
+            return cls({})
+
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            metrics.increment('resource_catalog.cache_hits')
+            return cached[1]
+        metrics.increment('resource_catalog.cache_misses')
+
+        with open(key, 'r') as f:
+            data = json.load(f)
+
+        catalog = cls(
+            data.get('resources', {}),
+            aliases=data.get('aliases'),
+            default_resources=data.get('default', DEFAULT_RESOURCES)
+        )
+        cls._cache[key] = (mtime, catalog)
+        metrics.set_gauge('resource_catalog.skills', len(catalog))
+        return catalog
+
+    def resolve(self, skill):
+        """Resolve a skill name or alias to its catalog id"""
+        skill_id = normalize_skill(skill)
+        return self.aliases.get(skill_id, skill_id)
+
+    def __contains__(self, skill):
+        return self.resolve(skill) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def count(self, skill):
+        """Number of resources available for a skill"""
+        return len(self._index.get(self.resolve(skill), ()))
+
+    def get_resources(self, skill, page=0, page_size=None):
+        """Get one page of ranked resources for a skill, falling back to the defaults"""
+        ranked = self._index.get(self.resolve(skill), self.default_resources)
+        if page_size is None:
+            return list(ranked)
+        start = page * page_size
+        return list(ranked[start:start + page_size])
+
+    def get_resources_bulk(self, skills, page=0, page_size=None):
+        """Get resources for many skills, keyed by the skill names as given"""
+        return {
+            skill: self.get_resources(skill, page, page_size)
+            for skill in skills
+        }
+
+    def get_resources_for_students(self, skills_per_student, page=0, page_size=None):
+        """Get resources for a cohort, resolving each distinct skill only once"""
+        pages = {}
+        results = []
+        for skills in skills_per_student:
+            student_resources = {}
+            for skill in skills:
+                if skill not in pages:
+                    pages[skill] = self.get_resources(skill, page, page_size)
+                student_resources[skill] = list(pages[skill])
+            results.append(student_resources)
+        return results
@@ -0,0 +1,250 @@
+import numpy as np
+from models.sharded_scorer import top_k_indices
+
+_NO_ROWS = np.array([], dtype=np.int32)
+# Slack for rounding error in the running dot products
+_TOLERANCE = 1e-9
+
+class ScoringSession:
+    """Keeps one student's career scores current as skills are added or removed.
+
+    The session holds the student's unnormalized TF-IDF dot product with every
+    career and the number of each career's required skills the student has.
+    Adding or removing a skill only touches the careers in the posting lists
+    of that skill's terms and of the skill itself. The top careers are kept
+    in a small candidate pool whose members are re-scored exactly, so the
+    displayed list matches find_career_matches, ties included.
+    """
+
+    def __init__(self, career_matcher, student, top_n=5):
+        self.career_matcher = career_matcher
+        self.recommender = career_matcher.recommender
+        self.student = student
+        self.top_n = top_n
+        self._pool_target = max(4 * top_n, top_n + 32)
+        self._displayed = []
+        self._rebuild()
+
+    def _rebuild(self):
+        """Score the student against the current catalog from scratch"""
+        recommender = self.recommender
+        n_careers = recommender.career_matrix.shape[0]
+
+        self.snapshot_version = recommender.snapshot_version
+        self._postings = recommender.term_postings
+        self._idf = np.asarray(recommender.idf, dtype=np.float64)
+        self._required_counts = recommender.required_skill_counts
+        self._term_counts = {}
+        self._skill_counts = {}
+        self._norm_sq = 0.0
+        self.dot = np.zeros(n_careers)
+        self.matched_counts = np.zeros(n_careers, dtype=np.int32)
+        # Terms each career shares with the student; careers sharing none
+        # are reset to exactly 0.0 so rounding error never breaks zero ties
+        self._shared_terms = np.zeros(n_careers, dtype=np.int32)
+
+        text = ' '.join(self.student.skills + self.student.interests)
+        self._apply_terms(recommender.term_counts(text), 1)
+        for skill in self.student.skills:
+            self._count_skill(skill, 1)
+        self._rebuild_pool()
+        self._displayed = self._build_display()
+
+    def _apply_terms(self, counts, sign):
+        """Update dot products for changed term counts; return the touched career rows"""
+        postings = self._postings
+        touched = []
+        for column, count in counts.items():
+            old = self._term_counts.get(column, 0)
+            new = old + sign * count
+            if new:
+                self._term_counts[column] = new
+            else:
+                self._term_counts.pop(column, None)
+
+            weight = self._idf[column]
+            self._norm_sq += (new * new - old * old) * weight * weight
+
+            start, stop = postings.indptr[column], postings.indptr[column + 1]
+            rows = postings.indices[start:stop]
+            self.dot[rows] += (new - old) * weight * postings.data[start:stop]
+            if not old:
+                self._shared_terms[rows] += 1
+            elif not new:
+                self._shared_terms[rows] -= 1
+                self.dot[rows[self._shared_terms[rows] == 0]] = 0.0
+            touched.append(rows)
+
+        if not self._term_counts:
+            # Clear accumulated rounding error once the vector is empty
+            self._norm_sq = 0.0
+            self.dot[:] = 0.0
+        return np.concatenate(touched) if touched else _NO_ROWS
+
+    def _count_skill(self, skill, sign):
+        """Update matched required-skill counts when a skill appears or disappears"""
+        old = self._skill_counts.get(skill, 0)
+        new = old + sign
+        if new:
+            self._skill_counts[skill] = new
+        else:
+            self._skill_counts.pop(skill, None)
+
+        if (old == 0) != (new == 0):
+            np.add.at(self.matched_counts, self.recommender.careers_requiring(skill), sign)
+
+    def _rebuild_pool(self):
+        """Take the best careers as the candidate pool; all others score at most _floor"""
+        n_careers = len(self.dot)
+        size = min(self._pool_target, n_careers)
+        if size < n_careers:
+            # Ties at the cut-off go to the lowest rows, as in recommend_careers
+            order = top_k_indices(self.dot, size + 1)
+            self._pool = order[:size]
+            self._floor = self.dot[order[size]]
+        else:
+            self._pool = np.arange(n_careers)
+            self._floor = -np.inf
+        self._in_pool = np.zeros(n_careers, dtype=bool)
+        self._in_pool[self._pool] = True
+
+    def _update_pool(self, touched):
+        """Admit touched careers that beat the pool floor and trim an oversized pool"""
+        touched = np.unique(touched)
+        outside = touched[~self._in_pool[touched]]
+        entering = outside[self.dot[outside] > self._floor]
+        if len(entering):
+            self._pool = np.concatenate((self._pool, entering))
+            self._in_pool[entering] = True
+
+        if len(self._pool) > 2 * self._pool_target:
+            ranked = self._pool[np.lexsort((self._pool, -self.dot[self._pool]))]
+            dropped = ranked[self._pool_target:]
+            self._floor = max(self._floor, self.dot[dropped].max())
+            self._in_pool[dropped] = False
+            self._pool = ranked[:self._pool_target]
+
+    def _ranked_pool(self):
+        """Pool careers with exact similarities, ordered like recommend_careers"""
+        # Built from the maintained term counts; equal to vectorizing the profile
+        student_vector = self.recommender.vector_from_counts(self._term_counts)
+
+        for attempt in range(2):
+            # Score pool rows exactly as recommend_careers does, so rounding
+            # error in the running dot products cannot reorder close careers
+            rows = self.recommender.career_matrix[self._pool]
+            scores = (rows @ student_vector.T).toarray().ravel()
+            order = np.lexsort((self._pool, -scores))
+            pool, scores = self._pool[order], scores[order]
+
+            # The top_n is settled once its last score clears every career
+            # outside the pool; a tie with the floor could favour a lower row.
+            # A freshly rebuilt pool already holds the lowest tied rows.
+            covered = len(pool) == len(self.dot)
+            if attempt or covered or (len(pool) >= self.top_n and
+                                      scores[self.top_n - 1] * np.sqrt(self._norm_sq) > self._floor + _TOLERANCE):
+                break
+            self._rebuild_pool()
+        return pool, scores
+
+    def skill_match_percentages(self):
+        """Share of each career's required skills the student has, in percent"""
+        return self.matched_counts * 100.0 / np.maximum(self._required_counts, 1)
+
+    def _build_display(self):
+        """Current recommendations, scored and ordered like find_career_matches"""
+        pool, scores = self._ranked_pool()
+        recommendations = []
+        for idx, score in zip(pool[:self.top_n], scores[:self.top_n]):
+            recommendation = self.recommender.build_recommendation(
+                idx, score, self.student.skills, int(self.matched_counts[idx])
+            )
+            recommendation['career_index'] = int(idx)
+            recommendations.append(recommendation)
+        return self.career_matcher.score_recommendations(self.student, recommendations)
+
+    def recommendations(self):
+        """The student's current recommendations"""
+        if self.recommender.snapshot_version != self.snapshot_version:
+            # The catalog was reloaded since the last update
+            self._rebuild()
+        return [dict(rec) for rec in self._displayed]
+
+    def _replace_display(self, displayed, key='career_index'):
+        """Show a new recommendation list and return the careers whose rank changed"""
+        old = {rec[key]: (rank, rec) for rank, rec in enumerate(self._displayed, 1)}
+        new = {rec[key]: (rank, rec) for rank, rec in enumerate(displayed, 1)}
+        self._displayed = displayed
+
+        changes = []
+        for career in list(old) + [career for career in new if career not in old]:
+            old_rank, old_rec = old.get(career, (None, None))
+            new_rank, new_rec = new.get(career, (None, None))
+            if old_rank == new_rank:
+                continue
+            rec = new_rec or old_rec
+            changes.append({
+                'career_index': rec['career_index'],
+                'career': rec['career'],
+                'old_rank': old_rank,
+                'new_rank': new_rank,
+                'skill_match_percentage': rec['skill_match_percentage'],
+                'overall_score': new_rec['overall_score'] if new_rec else None
+            })
+        changes.sort(key=lambda change: (change['new_rank'] is None, change['new_rank'] or 0))
+        return changes
+
+    def _update(self, added, removed):
+        """Apply skill removals and additions, then re-rank"""
+        if self.recommender.snapshot_version != self.snapshot_version:
+            # The catalog was reloaded: rescore everything and match careers
+            # by title, since row indices refer to the old catalog
+            self._apply_skill_lists(added, removed)
+            displayed = self._displayed
+            self._rebuild()
+            self._displayed, rebuilt = displayed, self._displayed
+            return self._replace_display(rebuilt, key='career')
+
+        touched = [_NO_ROWS]
+        for skill in removed:
+            touched.append(self._apply_terms(self.recommender.term_counts(skill), -1))
+            self._count_skill(skill, -1)
+        for skill in added:
+            touched.append(self._apply_terms(self.recommender.term_counts(skill), 1))
+            self._count_skill(skill, 1)
+        self._apply_skill_lists(added, removed)
+
+        self._update_pool(np.concatenate(touched))
+        return self._replace_display(self._build_display())
+
+    def _apply_skill_lists(self, added, removed):
+        """Mirror the change in the student's skill list"""
+        skills = list(self.student.skills)
+        for skill in removed:
+            skills.remove(skill)
+        skills.extend(added)
+        self.student.skills = skills
+
+    def add_skill(self, skill):
+        """Add a skill and return the careers whose rank changed"""
+        return self._update([skill], [])
+
+    def remove_skill(self, skill):
+        """Remove one occurrence of a skill and return the careers whose rank changed"""
+        if skill not in self.student.skills:
+            return []
+        return self._update([], [skill])
+
+    def set_skills(self, new_skills):
+        """Replace the skill list, applying only the difference"""
+        remaining = list(self.student.skills)
+        added = []
+        for skill in new_skills:
+            if skill in remaining:
+                remaining.remove(skill)
+            else:
+                added.append(skill)
+        changes = self._update(added, remaining)
+        # Keep the caller's ordering of skills
+        self.student.skills = list(new_skills)
+        return changes
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.batch_processor import BatchProcessor
+
+class TestBatchProcessing(unittest.TestCase):
+
+    def setUp(self):
+        """Write batch input and output into a temporary directory"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.tmpdir.name, 'recs.jsonl')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _run(self, filename, content, **kwargs):
+        input_path = os.path.join(self.tmpdir.name, filename)
+        with open(input_path, 'w') as f:
+            f.write(content)
+        summary = BatchProcessor(top_n=2, **kwargs).run(input_path, self.output_path)
+        with open(self.output_path) as f:
+            return summary, [json.loads(line) for line in f]
+
+    def test_batch_reports_bad_lines(self):
+        """Test that malformed batch lines are reported without losing other records"""
+        summary, results = self._run('students.jsonl', (
+            '{"student_id": 7, "skills": "1,4", "interests": "2"}\n'
+            '{"student_id": 8, "skills": \n'
+            '[1, 2]\n'
+            '{"skills": ["python"]}\n'
+        ))
+
+        self.assertEqual(summary['processed'], 4)
+        self.assertEqual(summary['failed'], 2)
+        self.assertEqual([result['student']['student_id'] for result in results], [7, 2, 3, 4])
+        self.assertEqual(len(results[0]['recommendations']), 2)
+        self.assertIn('error', results[1])
+        self.assertIn('error', results[2])
+
+    def test_csv_student_ids(self):
+        """Test that CSV ids are numeric like defaulted ids"""
+        summary, results = self._run('students.csv', (
+            'student_id,name,skills,interests\n'
+            '1,Ann,"1,4",2\n'
+            ',Bob,python,data_science\n'
+            'S-9,Cy,sql,business\n'
+        ))
+
+        self.assertEqual(summary['failed'], 0)
+        self.assertEqual([result['student']['student_id'] for result in results], [1, 2, 'S-9'])
+
+    def test_compact_workers(self):
+        """Test that batch workers can run the compact feature mode"""
+        summary, results = self._run('students.jsonl', '{"skills": "1,4", "interests": "2"}\n' * 3,
+                                     workers=2, chunk_size=1, compact=True, n_features=2 ** 12)
+
+        self.assertEqual(summary['failed'], 0)
+        self.assertEqual(len(results[0]['recommendations']), 2)
+
+if __name__ == '__main__':
+    unittest.main()
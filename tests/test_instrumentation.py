@@ -0,0 +1,90 @@
+import unittest
+import json
+import sys
+import os
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.instrumentation import Metrics
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.metrics = Metrics(enabled=False, profile_sample_rate=0)
+
+    def test_disabled_records_nothing(self):
+        """Test that disabled metrics skip timers, counters and gauges"""
+        @self.metrics.timed('work')
+        def work():
+            return 42
+
+        self.assertEqual(work(), 42)
+        with self.metrics.timer('block'):
+            pass
+        self.metrics.increment('hits')
+        self.metrics.set_gauge('size', 10)
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['timers'], {})
+        self.assertEqual(snapshot['counters'], {})
+        self.assertEqual(snapshot['gauges'], {})
+
+    def test_configure_only_enables(self):
+        """Test that a constructor flag of False does not switch shared metrics off"""
+        self.metrics.configure(True)
+        self.metrics.configure(False)
+        self.metrics.configure(None)
+        self.assertTrue(self.metrics.enabled)
+
+        self.metrics.disable()
+        self.assertFalse(self.metrics.enabled)
+
+    def test_invalid_sample_rate(self):
+        """Test that a bad profiling sample rate falls back to 0 and rates are clamped"""
+        self.assertEqual(Metrics(profile_sample_rate='abc').profile_sample_rate, 0.0)
+        self.assertEqual(Metrics(profile_sample_rate='2').profile_sample_rate, 1.0)
+        self.assertEqual(Metrics(profile_sample_rate=-0.5).profile_sample_rate, 0.0)
+
+        self.metrics.enable(profile_sample_rate='0.25')
+        self.assertEqual(self.metrics.profile_sample_rate, 0.25)
+
+    def test_enabled_snapshot_and_export(self):
+        """Test timers, counters and gauges in dict, JSON and Prometheus form"""
+        self.metrics.enable()
+
+        @self.metrics.timed('work')
+        def work():
+            return 42
+
+        work()
+        work()
+        self.metrics.increment('cache_hits', 3)
+        self.metrics.set_gauge('careers', 10)
+
+        snapshot = json.loads(self.metrics.to_json())
+        self.assertEqual(snapshot['timers']['work']['count'], 2)
+        self.assertEqual(snapshot['counters']['cache_hits'], 3)
+        self.assertEqual(snapshot['gauges']['careers'], 10)
+
+        text = self.metrics.to_prometheus()
+        self.assertIn('career_recommender_duration_seconds_count{name="work"} 2', text)
+        self.assertIn('career_recommender_events_total{name="cache_hits"} 3', text)
+        self.assertIn('career_recommender_size{name="careers"} 10', text)
+
+    def test_sampled_profiling(self):
+        """Test that sampled calls are captured by cProfile"""
+        self.metrics.enable(profile_sample_rate=1.0)
+
+        @self.metrics.profiled('work')
+        def work():
+            return sum(range(100))
+
+        self.assertEqual(work(), 4950)
+        self.assertEqual(len(self.metrics.profiles), 1)
+        self.assertEqual(self.metrics.profiles[0]['name'], 'work')
+        self.assertEqual(self.metrics.snapshot()['counters']['profiler.samples'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
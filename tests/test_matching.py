@@ -1,10 +1,13 @@
 import unittest
 import sys
 import os
+import json
 
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
+from models.recommender_model import CareerRecommender, ranking_agreement
 from models.student import Student
 from services.career_matcher import CareerMatcher
 from services.profile_manager import ProfileManager
@@ -65,6 +68,164 @@ class TestCareerMatching(unittest.TestCase):
             self.assertLessEqual(rec['overall_score'], 1)
             self.assertGreaterEqual(rec['skill_match_percentage'], 0)
             self.assertLessEqual(rec['skill_match_percentage'], 100)
+    
+    def test_filtered_recommendations(self):
+        """Test that facet filters restrict careers before scoring"""
+        recommendations = self.career_matcher.find_career_matches(
+            self.test_student, top_n=10,
+            industry="Technology", growth_potential=["High", "Very High"],
+            min_salary=75000, max_education="Bachelor"
+        )
+        
+        careers = sorted(rec['career'] for rec in recommendations)
+        self.assertEqual(careers, ["Cybersecurity Analyst", "DevOps Engineer"])
+        
+        none_left = self.career_matcher.find_career_matches(
+            self.test_student, industry="Design", growth_potential="High"
+        )
+        self.assertEqual(none_left, [])
+        
+        # "50,000-85,000" ends at or below 90,000; "50,000-90,000" does too
+        capped = self.career_matcher.find_career_matches(self.test_student, top_n=10, max_salary=90000)
+        self.assertEqual(sorted(rec['career'] for rec in capped), ["UX Designer", "Web Developer"])
+        floor = self.career_matcher.find_career_matches(self.test_student, top_n=10, min_salary=90000)
+        self.assertEqual(sorted(rec['career'] for rec in floor), ["AI Engineer", "Cloud Architect"])
+        
+        # Plain lists of rows work as candidates too
+        from_list = self.career_matcher.recommender.recommend_careers(["python"], [], 5, candidates=[5, 0, 2])
+        self.assertEqual(
+            sorted(rec['career'] for rec in from_list),
+            ["Data Scientist", "DevOps Engineer", "Web Developer"]
+        )
+    
+    def test_compact_feature_mode(self):
+        """Test that compact mode stores float32 features and int32 skill ids"""
+        compact = CareerRecommender(compact=True, n_features=2 ** 12)
+        compact.load_data(self.career_matcher.careers_df)
+        
+        self.assertEqual(compact.career_matrix.dtype, np.float32)
+        self.assertEqual(compact.career_matrix.shape[1], 2 ** 12)
+        self.assertEqual(compact.skill_ids.dtype, np.int32)
+        self.assertEqual(compact.required_skill_ids.dtype, np.int32)
+        self.assertEqual(len(compact.required_skill_offsets), len(self.career_matcher.careers_df) + 1)
+        
+        profiles = [(["python", "sql", "statistics"], ["data_science"]), (["aws", "docker"], ["cloud_computing"])]
+        agreement = ranking_agreement(self.career_matcher.recommender, compact, profiles, k=3)
+        self.assertGreaterEqual(agreement, 0.9)
+        
+        compact_matcher = CareerMatcher('data/careers.csv', compact=True, n_features=2 ** 12)
+        self.assertTrue(compact_matcher.recommender.compact)
+        recommendations = compact_matcher.find_career_matches(self.test_student, top_n=3)
+        self.assertIsInstance(recommendations[0]['overall_score'], float)
+        json.dumps(recommendations)
+    
+    def test_sharded_scoring_matches_in_process(self):
+        """Test that sharded scoring returns the same ranking as in-process scoring"""
+        recommender = self.career_matcher.recommender
+        # Few careers share terms with this profile, so most score 0.0 and tie
+        queries = [(["python", "sql"], ["data_science"]), (["sql", "agile"], ["design"])]
+        expected = [recommender.recommend_careers(skills, interests, 5) for skills, interests in queries]
+        candidates = recommender.facet_index.candidates(industry="Technology")
+        expected_filtered = recommender.recommend_careers(["python", "sql"], ["data_science"], 3, candidates)
+        
+        recommender.enable_sharded_scoring(n_workers=2)
+        try:
+            for (skills, interests), in_process in zip(queries, expected):
+                sharded = recommender.recommend_careers(skills, interests, 5)
+                self.assertEqual(
+                    [(rec['career'], rec['similarity_score']) for rec in sharded],
+                    [(rec['career'], rec['similarity_score']) for rec in in_process]
+                )
+            filtered = recommender.recommend_careers(["python", "sql"], ["data_science"], 3, candidates)
+            self.assertEqual([rec['career'] for rec in filtered], [rec['career'] for rec in expected_filtered])
+            
+            # Reloading the catalog publishes a new snapshot to the workers
+            recommender.load_data(self.career_matcher.careers_df.head(4))
+            reloaded = recommender.recommend_careers(["python", "sql"], ["data_science"], 10)
+            self.assertEqual(len(reloaded), 4)
+            self.assertEqual(recommender.scorer._version, recommender.snapshot_version)
+        finally:
+            recommender.close()
+        self.assertIsNone(recommender.scorer)
+    
+    def test_scoring_session_matches_full_rescore(self):
+        """Test that delta re-scoring after skill changes matches a fresh match"""
+        session = self.profile_manager.open_scoring_session(100, self.career_matcher, top_n=3)
+        
+        def ranking(recommendations):
+            return [(rec['career'], rec['overall_score']) for rec in recommendations]
+        
+        changes = self.profile_manager.add_student_skill(100, "machine_learning")
+        self.assertIn("machine_learning", self.test_student.skills)
+        self.assertEqual(
+            ranking(session.recommendations()),
+            ranking(self.career_matcher.find_career_matches(self.test_student, top_n=3))
+        )
+        for change in changes:
+            self.assertNotEqual(change['old_rank'], change['new_rank'])
+        
+        self.profile_manager.remove_student_skill(100, "sql")
+        self.profile_manager.update_student_skills(100, ["aws", "docker", "python"])
+        self.assertEqual(self.test_student.skills, ["aws", "docker", "python"])
+        self.assertEqual(
+            ranking(session.recommendations()),
+            ranking(self.career_matcher.find_career_matches(self.test_student, top_n=3))
+        )
+        
+        # Reloading the catalog is picked up without a skill update
+        self.career_matcher.recommender.load_data(self.career_matcher.careers_df.head(4))
+        self.assertEqual(
+            ranking(session.recommendations()),
+            ranking(self.career_matcher.find_career_matches(self.test_student, top_n=3))
+        )
+    
+    def test_scoring_session_skill_match_counts(self):
+        """Test that maintained matched-skill counts drive the displayed skill match"""
+        session = self.profile_manager.open_scoring_session(100, self.career_matcher, top_n=3)
+        session.add_skill("statistics")
+        session.remove_skill("data_analysis")
+        
+        careers_df = self.career_matcher.careers_df
+        expected = [
+            100.0 * sum(skill in self.test_student.skills for skill in required.split(',')) / len(required.split(','))
+            for required in careers_df['required_skills']
+        ]
+        self.assertEqual(session.skill_match_percentages().tolist(), expected)
+        for rec in session.recommendations():
+            self.assertEqual(rec['skill_match_percentage'], round(expected[rec['career_index']], 1))
+    
+    def test_recreated_profile_drops_session(self):
+        """Test that re-creating a profile does not leave updates going to the old Student"""
+        self.profile_manager.open_scoring_session(100, self.career_matcher)
+        student = self.profile_manager.create_student_profile(100, "Test Student", "Bachelor", ["java"], [], "")
+        self.assertNotIn(100, self.profile_manager.sessions)
+        
+        self.assertTrue(self.profile_manager.update_student_skills(100, ["sql"]))
+        self.assertEqual(student.skills, ["sql"])
+        
+        # A session whose Student was swapped out behind the manager is dropped too
+        session = self.profile_manager.open_scoring_session(100, self.career_matcher)
+        self.profile_manager.students[100] = replacement = self.test_student
+        self.assertEqual(self.profile_manager.add_student_skill(100, "aws"), [])
+        self.assertIn("aws", replacement.skills)
+        self.assertNotIn("aws", session.student.skills)
+    
+    def test_scoring_session_zero_score_ties(self):
+        """Test that sessions break zero-score ties like find_career_matches"""
+        student = self.profile_manager.create_student_profile(
+            101, "Tie Student", "Master", ["figma"], ["design"], "Design products"
+        )
+        session = self.profile_manager.open_scoring_session(101, self.career_matcher, top_n=5)
+        
+        for update in (lambda: session.add_skill("agile"), lambda: session.remove_skill("figma"),
+                       lambda: session.add_skill("sql"), lambda: session.remove_skill("agile")):
+            update()
+            expected = self.career_matcher.find_career_matches(student, top_n=5)
+            self.assertIn(0.0, [rec['similarity_score'] for rec in expected])
+            self.assertEqual(
+                [(rec['career'], rec['overall_score']) for rec in session.recommendations()],
+                [(rec['career'], rec['overall_score']) for rec in expected]
+            )
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
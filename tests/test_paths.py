@@ -0,0 +1,90 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.path_generator import PathGenerator
+from services.profile_manager import ProfileManager
+from services.resource_catalog import ResourceCatalog, normalize_skill
+
+class TestLearningPaths(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.path_generator = PathGenerator('data/careers.csv')
+        self.profile_manager = ProfileManager()
+
+        self.test_student = self.profile_manager.create_student_profile(
+            student_id=200,
+            name="Path Student",
+            education_level="Bachelor",
+            skills=["python", "sql"],
+            interests=["data_science"],
+            goals="Become a data scientist"
+        )
+
+    def test_generate_learning_path(self):
+        """Test that a learning path covers the skill gaps"""
+        learning_path = self.path_generator.generate_learning_path(self.test_student, "Data Scientist")
+
+        self.assertIsNotNone(learning_path)
+        self.assertEqual(learning_path['current_skills_match'], "2/4")
+        self.assertEqual(learning_path['skill_gaps'], ["machine_learning", "statistics"])
+        self.assertEqual(
+            learning_path['resources']['machine_learning'],
+            ['Coursera ML course', 'Fast.ai', 'Kaggle tutorials']
+        )
+
+    def test_skill_normalization(self):
+        """Test that free-text skill names resolve to catalog ids"""
+        self.assertEqual(normalize_skill("Machine Learning"), "machine_learning")
+        self.assertEqual(normalize_skill(" data-analysis "), "data_analysis")
+
+        catalog = self.path_generator.resource_catalog
+        self.assertEqual(catalog.resolve("machine learning"), "machine_learning")
+        self.assertEqual(catalog.resolve("K8s"), "kubernetes")
+        self.assertEqual(catalog.get_resources("ML")[0], 'Coursera ML course')
+
+    def test_unknown_skill_uses_defaults(self):
+        """Test fallback resources for skills missing from the catalog"""
+        resources = self.path_generator._get_learning_resources(["algorithms"])
+        self.assertEqual(resources["algorithms"], ['Online tutorials', 'Documentation', 'Practice projects'])
+
+    def test_ranked_pagination(self):
+        """Test that resources are ranked and paginated"""
+        catalog = ResourceCatalog({
+            'python': [{'title': f'Resource {i}', 'rank': 1000 - i} for i in range(1000)]
+        })
+
+        self.assertEqual(catalog.count('Python'), 1000)
+        first_page = catalog.get_resources('python', page=0, page_size=10)
+        self.assertEqual(first_page[0], 'Resource 999')
+        self.assertEqual(len(first_page), 10)
+        self.assertEqual(catalog.get_resources('python', page=99, page_size=10)[-1], 'Resource 0')
+        self.assertEqual(catalog.get_resources('python', page=100, page_size=10), [])
+
+    def test_bulk_lookup_for_students(self):
+        """Test resource lookup for a cohort of students"""
+        catalog = self.path_generator.resource_catalog
+        results = catalog.get_resources_for_students(
+            [["python"], ["machine learning", "sql"]], page_size=1
+        )
+
+        self.assertEqual(results[0], {"python": ["Python.org tutorial"]})
+        self.assertEqual(results[1]["machine learning"], ["Coursera ML course"])
+        self.assertEqual(results[1]["sql"], ["SQLZoo"])
+        self.assertEqual(catalog.get_resources_bulk(["algorithms"], page_size=1), {"algorithms": ["Online tutorials"]})
+        self.assertEqual(catalog.get_resources("algorithms", page=1, page_size=2), ["Practice projects"])
+
+    def test_merged_keys_stay_ranked(self):
+        """Test that keys normalizing to the same id are merged in rank order"""
+        catalog = ResourceCatalog({
+            'Machine Learning': [{'title': 'Second', 'rank': 2}, {'title': 'Fourth', 'rank': 4}],
+            'machine_learning': [{'title': 'First', 'rank': 1}, {'title': 'Third', 'rank': 3}]
+        })
+        self.assertEqual(catalog.get_resources('machine learning'), ['First', 'Second', 'Third', 'Fourth'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -87,6 +87,27 @@ class TestProfileManagement(unittest.TestCase):
         self.assertEqual(analysis['total_skills'], 2)
         self.assertEqual(analysis['total_interests'], 2)
     
+    def test_create_student_from_record(self):
+        """Test mapping batch records with menu numbers and free text"""
+        student = self.profile_manager.create_student_from_record({
+            "name": "Batch User",
+            "education": "3",
+            "skills": "1,4,99",
+            "interests": ["Data Science", "3"],
+            "goal": "11",
+            "custom_goal": "Lead a data team"
+        }, default_id=5)
+        
+        self.assertEqual(student.student_id, 5)
+        self.assertEqual(student.education_level, "Master")
+        self.assertEqual(student.skills, ["python", "sql"])
+        self.assertEqual(student.interests, ["data_science", "web_development"])
+        self.assertEqual(student.goals, "Lead a data team")
+        self.assertIs(self.profile_manager.get_student(5), student)
+        
+        free_text = self.profile_manager.create_student_from_record({"skills": ["Machine Learning", "SQL"]}, 6)
+        self.assertEqual(free_text.skills, ["machine_learning", "sql"])
+    
     def test_sentiment_analysis(self):
         """Test NLP sentiment analysis"""
         positive_feedback = "I love this career recommendation system!"
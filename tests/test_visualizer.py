@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the parent directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.visualizer import CareerVisualizer, render_cohort_reports
+
+RECOMMENDATIONS = [
+    {'career': 'Data Scientist', 'overall_score': 0.8, 'skill_match_percentage': 75.0},
+    {'career': 'Data Analyst', 'overall_score': 0.6, 'skill_match_percentage': 50.0}
+]
+
+class TestHeadlessReports(unittest.TestCase):
+
+    def setUp(self):
+        """Write reports into a temporary directory"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.output_dir = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_headless_output_and_figure_reuse(self):
+        """Test that headless reports are written to disk and figures are reused"""
+        learning_path = {'target_career': 'Data Scientist', 'skill_gaps': ['statistics']}
+        with CareerVisualizer(headless=True, output_dir=self.output_dir) as visualizer:
+            first = visualizer.render_student_report("John Smith", RECOMMENDATIONS, learning_path, student_id=1)
+            figure = visualizer._figures['recommendation_scores']
+            second = visualizer.render_student_report("john-smith", RECOMMENDATIONS, student_id=2)
+
+            self.assertIs(visualizer._figures['recommendation_scores'], figure)
+            self.assertEqual(len(first), 2)
+            self.assertNotEqual(first[0], second[0])
+            for path in first + second:
+                self.assertTrue(os.path.exists(path))
+        self.assertEqual(visualizer._figures, {})
+
+    def test_skill_gaps_without_name(self):
+        """Test that skill-gap files are kept apart by student id alone"""
+        learning_path = {'target_career': 'Data Scientist', 'skill_gaps': ['statistics']}
+        with CareerVisualizer(headless=True, output_dir=self.output_dir) as visualizer:
+            first = visualizer.plot_skill_gaps(learning_path, student_id=1)
+            second = visualizer.plot_skill_gaps(learning_path, student_id=2)
+            unnamed = visualizer.plot_skill_gaps(learning_path)
+
+        self.assertTrue(first.endswith('1_data_scientist_skill_gaps.png'))
+        self.assertNotEqual(first, second)
+        self.assertTrue(os.path.basename(unnamed).startswith('data_scientist'))
+
+    def test_render_cohort_reports(self):
+        """Test that same-named students in a cohort get separate files"""
+        reports = [
+            {'student_name': 'John Smith', 'recommendations': RECOMMENDATIONS},
+            {'student_name': 'john-smith', 'recommendations': RECOMMENDATIONS},
+            {'student_name': 'John Smith', 'recommendations': RECOMMENDATIONS, 'student_id': 'S42'}
+        ]
+        for workers in (1, 2):
+            paths = render_cohort_reports(reports, output_dir=self.output_dir, workers=workers, chunksize=1)
+            written = [report_paths[0] for report_paths in paths]
+
+            self.assertEqual(len(set(written)), 3)
+            self.assertTrue(written[2].endswith('s42_john_smith_scores.png'))
+            for path in written:
+                self.assertTrue(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,243 @@
+"""Lightweight timers, counters and sampled profiling for the hot paths.
+
+Instrumentation is off by default and costs one attribute check per call
+while disabled. Enable it with CAREER_METRICS=1 in the environment or by
+passing instrument=True to CareerMatcher, PathGenerator or NLPProcessor.
+The switch is process-wide: instrument=False never turns metrics off, call
+metrics.disable() for that.
+Set CAREER_PROFILE_SAMPLE_RATE (0-1) to run that fraction of profiled
+requests under cProfile, and CAREER_PROFILE_DIR to also dump them as
+.prof files.
+"""
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import random
+import re
+import threading
+import time
+
+ENV_ENABLED = 'CAREER_METRICS'
+ENV_PROFILE_SAMPLE_RATE = 'CAREER_PROFILE_SAMPLE_RATE'
+ENV_PROFILE_DIR = 'CAREER_PROFILE_DIR'
+
+
+def _parse_sample_rate(value):
+    """Read a profiling sample rate, clamped to [0, 1]; bad values disable profiling"""
+    try:
+        rate = float(value or 0)
+    except (TypeError, ValueError):
+        print(f"Ignoring invalid {ENV_PROFILE_SAMPLE_RATE}: {value!r}")
+        return 0.0
+    if rate != rate:
+        return 0.0
+    return min(max(rate, 0.0), 1.0)
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """Registry of timers, counters and gauges with JSON and Prometheus export"""
+
+    def __init__(self, enabled=None, profile_sample_rate=None, profile_dir=None, max_profiles=20):
+        if enabled is None:
+            enabled = os.environ.get(ENV_ENABLED, '').lower() in ('1', 'true', 'yes', 'on')
+        if profile_sample_rate is None:
+            profile_sample_rate = os.environ.get(ENV_PROFILE_SAMPLE_RATE)
+        if profile_dir is None:
+            profile_dir = os.environ.get(ENV_PROFILE_DIR) or None
+
+        self.enabled = enabled
+        self.profile_sample_rate = _parse_sample_rate(profile_sample_rate)
+        self.profile_dir = profile_dir
+        self.max_profiles = max_profiles
+        self.profiles = []
+        self._timers = {}
+        self._counters = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def enable(self, profile_sample_rate=None):
+        self.enabled = True
+        if profile_sample_rate is not None:
+            self.profile_sample_rate = _parse_sample_rate(profile_sample_rate)
+
+    def disable(self):
+        self.enabled = False
+
+    def configure(self, instrument):
+        """Apply a constructor instrument flag.
+
+        The registry is shared by the whole process, so the flag can only
+        turn metrics on; use disable() to switch them off for every service.
+        """
+        if instrument:
+            self.enabled = True
+
+    def reset(self):
+        """Drop all recorded values"""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self._gauges.clear()
+            self.profiles = []
+
+    def timer(self, name):
+        """Context manager that records the elapsed time of its block under name"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name):
+        """Decorator that records the elapsed time of each call under name"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def profiled(self, name):
+        """Decorator that runs a sample of calls under cProfile"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if (not self.enabled or self.profile_sample_rate <= 0
+                        or random.random() >= self.profile_sample_rate):
+                    return func(*args, **kwargs)
+                profiler = cProfile.Profile()
+                try:
+                    return profiler.runcall(func, *args, **kwargs)
+                finally:
+                    self._record_profile(name, profiler)
+            return wrapper
+        return decorator
+
+    def _record_profile(self, name, profiler):
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(25)
+        entry = {'name': name, 'timestamp': time.time(), 'stats': stream.getvalue()}
+
+        if self.profile_dir:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            filepath = os.path.join(
+                self.profile_dir, f"{name}-{os.getpid()}-{time.time_ns()}.prof"
+            )
+            profiler.dump_stats(filepath)
+            entry['path'] = filepath
+
+        with self._lock:
+            self.profiles.append(entry)
+            del self.profiles[:-self.max_profiles]
+        self.increment('profiler.samples')
+
+    def observe(self, name, seconds):
+        """Record one timing sample"""
+        with self._lock:
+            stats = self._timers.get(name)
+            if stats is None:
+                self._timers[name] = [1, seconds, seconds, seconds]
+            else:
+                stats[0] += 1
+                stats[1] += seconds
+                stats[2] = min(stats[2], seconds)
+                stats[3] = max(stats[3], seconds)
+
+    def increment(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self):
+        """Return all recorded values as a plain dict"""
+        with self._lock:
+            timers = {
+                name: {
+                    'count': count,
+                    'total_seconds': total,
+                    'mean_seconds': total / count,
+                    'min_seconds': minimum,
+                    'max_seconds': maximum
+                }
+                for name, (count, total, minimum, maximum) in self._timers.items()
+            }
+            return {
+                'enabled': self.enabled,
+                'timers': timers,
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'profiles': len(self.profiles)
+            }
+
+    def to_json(self, indent=None):
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def to_prometheus(self, prefix='career_recommender'):
+        """Render the snapshot in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        prefix = re.sub(r'[^a-zA-Z0-9_]', '_', prefix)
+        lines = []
+
+        if snapshot['timers']:
+            lines.append(f"# TYPE {prefix}_duration_seconds summary")
+            for name, stats in sorted(snapshot['timers'].items()):
+                label = _label(name)
+                lines.append(f'{prefix}_duration_seconds_count{{name="{label}"}} {stats["count"]}')
+                lines.append(f'{prefix}_duration_seconds_sum{{name="{label}"}} {stats["total_seconds"]:.9f}')
+        if snapshot['counters']:
+            lines.append(f"# TYPE {prefix}_events_total counter")
+            for name, value in sorted(snapshot['counters'].items()):
+                lines.append(f'{prefix}_events_total{{name="{_label(name)}"}} {value}')
+        if snapshot['gauges']:
+            lines.append(f"# TYPE {prefix}_size gauge")
+            for name, value in sorted(snapshot['gauges'].items()):
+                lines.append(f'{prefix}_size{{name="{_label(name)}"}} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Shared registry used by the services
+metrics = Metrics()
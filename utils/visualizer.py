@@ -1,74 +1,192 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib.style as mplstyle
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 class CareerVisualizer:
-    def __init__(self):
-        plt.style.use('seaborn-v0_8')
-        
-    def plot_recommendation_scores(self, recommendations, student_name):
+    def __init__(self, headless=False, output_dir='reports', image_format='png', style='seaborn-v0_8'):
+        self.headless = headless
+        self.output_dir = output_dir
+        self.image_format = image_format
+        self.style = style
+        # Headless figures are plain Agg figures kept out of pyplot's global
+        # registry, so they can be reused per student and freed on close().
+        self._figures = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release all figures held for reuse"""
+        for fig in self._figures.values():
+            fig.clear()
+        self._figures.clear()
+
+    def _get_figure(self, name, figsize):
+        """Get a cleared figure, reusing the previous one in headless mode"""
+        if not self.headless:
+            import matplotlib.pyplot as plt
+            return plt.figure(figsize=figsize)
+
+        fig = self._figures.get(name)
+        if fig is None:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            self._figures[name] = fig
+        else:
+            fig.clear()
+        return fig
+
+    def _finish(self, fig, filename):
+        """Show the figure interactively or write it to the output directory"""
+        fig.tight_layout()
+        if not self.headless:
+            import matplotlib.pyplot as plt
+            plt.show()
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        filepath = os.path.join(self.output_dir, f"{filename}.{self.image_format}")
+        fig.savefig(filepath, format=self.image_format)
+        return filepath
+
+    @staticmethod
+    def _slugify(text):
+        return re.sub(r'[^A-Za-z0-9]+', '_', str(text)).strip('_').lower() or 'report'
+
+    def _file_prefix(self, student_name, student_id=None):
+        """Filename prefix for a student; the id keeps students with similar names apart"""
+        parts = []
+        if student_id is not None:
+            parts.append(self._slugify(student_id))
+        if student_name:
+            parts.append(self._slugify(student_name))
+        return '_'.join(parts)
+
+    def plot_recommendation_scores(self, recommendations, student_name, student_id=None):
         """Plot recommendation scores for a student"""
         if not recommendations:
             print("No recommendations to visualize")
-            return
-            
+            return None
+
         careers = [rec['career'] for rec in recommendations]
         overall_scores = [rec['overall_score'] for rec in recommendations]
         skill_matches = [rec['skill_match_percentage'] for rec in recommendations]
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Overall scores
-        ax1.barh(careers, overall_scores, color='skyblue')
-        ax1.set_xlabel('Overall Score')
-        ax1.set_title(f'Career Recommendations for {student_name}')
-        ax1.set_xlim(0, 1)
-        
-        # Skill match percentages
-        ax2.barh(careers, skill_matches, color='lightgreen')
-        ax2.set_xlabel('Skill Match (%)')
-        ax2.set_title('Skill Compatibility')
-        ax2.set_xlim(0, 100)
-        
-        plt.tight_layout()
-        plt.show()
-    
-    def plot_skill_gaps(self, learning_path):
+
+        with mplstyle.context(self.style):
+            fig = self._get_figure('recommendation_scores', (15, 6))
+            ax1, ax2 = fig.subplots(1, 2)
+
+            # Overall scores
+            ax1.barh(careers, overall_scores, color='skyblue')
+            ax1.set_xlabel('Overall Score')
+            ax1.set_title(f'Career Recommendations for {student_name}')
+            ax1.set_xlim(0, 1)
+
+            # Skill match percentages
+            ax2.barh(careers, skill_matches, color='lightgreen')
+            ax2.set_xlabel('Skill Match (%)')
+            ax2.set_title('Skill Compatibility')
+            ax2.set_xlim(0, 100)
+
+            return self._finish(fig, f"{self._file_prefix(student_name, student_id)}_scores")
+
+    def plot_skill_gaps(self, learning_path, student_name=None, student_id=None):
         """Visualize skill gaps for a learning path"""
         if not learning_path or 'skill_gaps' not in learning_path:
             print("No skill gap data to visualize")
-            return
-            
+            return None
+
         skill_gaps = learning_path['skill_gaps']
-        
+
         if not skill_gaps:
             print("No skill gaps identified!")
-            return
-            
-        plt.figure(figsize=(10, 6))
-        y_pos = range(len(skill_gaps))
-        
-        plt.barh(y_pos, [1] * len(skill_gaps), color='red', alpha=0.7)
-        plt.yticks(y_pos, skill_gaps)
-        plt.xlabel('Skills to Learn')
-        plt.title(f"Skill Gaps for {learning_path['target_career']}")
-        plt.tight_layout()
-        plt.show()
-    
+            return None
+
+        with mplstyle.context(self.style):
+            fig = self._get_figure('skill_gaps', (10, 6))
+            ax = fig.subplots()
+            y_pos = range(len(skill_gaps))
+
+            ax.barh(y_pos, [1] * len(skill_gaps), color='red', alpha=0.7)
+            ax.set_yticks(y_pos, skill_gaps)
+            ax.set_xlabel('Skills to Learn')
+            ax.set_title(f"Skill Gaps for {learning_path['target_career']}")
+
+            prefix = self._file_prefix(student_name, student_id)
+            prefix = prefix + '_' if prefix else ''
+            return self._finish(fig, f"{prefix}{self._slugify(learning_path['target_career'])}_skill_gaps")
+
     def plot_career_distribution(self, careers_df):
         """Plot distribution of careers by industry and growth potential"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Industry distribution
-        industry_counts = careers_df['industry'].value_counts()
-        ax1.pie(industry_counts.values, labels=industry_counts.index, autopct='%1.1f%%')
-        ax1.set_title('Career Distribution by Industry')
-        
-        # Growth potential distribution
-        growth_counts = careers_df['growth_potential'].value_counts()
-        sns.barplot(x=growth_counts.index, y=growth_counts.values, ax=ax2, palette='viridis')
-        ax2.set_title('Career Distribution by Growth Potential')
-        ax2.set_ylabel('Number of Careers')
-        
-        plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        import seaborn as sns
+
+        with mplstyle.context(self.style):
+            fig = self._get_figure('career_distribution', (15, 6))
+            ax1, ax2 = fig.subplots(1, 2)
+
+            # Industry distribution
+            industry_counts = careers_df['industry'].value_counts()
+            ax1.pie(industry_counts.values, labels=industry_counts.index, autopct='%1.1f%%')
+            ax1.set_title('Career Distribution by Industry')
+
+            # Growth potential distribution
+            growth_counts = careers_df['growth_potential'].value_counts()
+            sns.barplot(x=growth_counts.index, y=growth_counts.values, ax=ax2, palette='viridis')
+            ax2.set_title('Career Distribution by Growth Potential')
+            ax2.set_ylabel('Number of Careers')
+
+            return self._finish(fig, 'career_distribution')
+
+    def render_student_report(self, student_name, recommendations, learning_path=None, student_id=None):
+        """Render all report figures for one student and return the written file paths"""
+        paths = [self.plot_recommendation_scores(recommendations, student_name, student_id)]
+        if learning_path:
+            paths.append(self.plot_skill_gaps(learning_path, student_name, student_id))
+        return [path for path in paths if path]
+
+
+_worker_visualizer = None
+
+def _init_report_worker(output_dir, image_format, style):
+    global _worker_visualizer
+    _worker_visualizer = CareerVisualizer(
+        headless=True, output_dir=output_dir, image_format=image_format, style=style
+    )
+
+def _render_report(visualizer, position, report):
+    # Fall back to the report's position so same-named students never share files
+    return visualizer.render_student_report(
+        report['student_name'], report['recommendations'], report.get('learning_path'),
+        report.get('student_id', position)
+    )
+
+def _render_report_in_worker(item):
+    return _render_report(_worker_visualizer, *item)
+
+def render_cohort_reports(reports, output_dir='reports', image_format='png',
+                          style='seaborn-v0_8', workers=None, chunksize=8):
+    """Render headless reports for many students in a process pool.
+
+    Each report is a dict with 'student_name', 'recommendations' and
+    optional 'learning_path' and 'student_id' (files are prefixed with the
+    id, or the report's position when it is missing). Every worker process keeps one visualizer and
+    reuses its figures for all the students it renders. Returns the list of
+    written file paths per report, in input order.
+    """
+    if workers == 1:
+        with CareerVisualizer(headless=True, output_dir=output_dir,
+                              image_format=image_format, style=style) as visualizer:
+            return [
+                _render_report(visualizer, position, report)
+                for position, report in enumerate(reports)
+            ]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_report_worker,
+                             initargs=(output_dir, image_format, style)) as executor:
+        return list(executor.map(_render_report_in_worker, enumerate(reports), chunksize=chunksize))